@@ -1,4 +1,6 @@
 """Dependencies for API endpoints (authentication, authorization)."""
+import ipaddress
+import sys
 from typing import Annotated
 
 from fastapi import Depends, Header, Request
@@ -13,11 +15,33 @@ from app.common.exceptions import (
     InvalidTokenException,
 )
 from app.domain.permissions import has_permission
+from app.domain.token_service import validate_token_format
 from app.usecase.auth_usecase import AuthUsecase
+from app.models.audit_log import HTTP_METHOD_VALUES
 from app.models.user import User
 from app.models.token import Token
 
 
+# Interned HTTP methods, so queued audit entries share one string per method
+HTTP_METHODS = {method: sys.intern(method) for method in HTTP_METHOD_VALUES}
+
+
+def _client_ip(request: Request) -> str | None:
+    """Get the client IP address, or None if it is missing or not an IP.
+
+    The audit log stores it in an inet column, which rejects anything else
+    (e.g. a unix socket path).
+    """
+    if not request.client:
+        return None
+    host = request.client.host
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return None
+    return host
+
+
 async def get_current_user_from_jwt(
     authorization: Annotated[str | None, Header()] = None,
     session: AsyncSession = Depends(get_db),
@@ -82,9 +106,14 @@ async def get_current_token_from_pat(
     pat_token = parts[1]
 
     # Extract HTTP context information
-    client_ip = request.client.host if request.client else "unknown"
-    method = request.method
-    endpoint = str(request.url.path)
+    client_ip = _client_ip(request)
+    method = HTTP_METHODS.get(request.method, request.method)
+    # The raw ASGI path; request.url would build and parse a full URL object
+    endpoint = request.scope["path"]
+    if not request.path_params:
+        # Without path params the path is a route template, a small fixed
+        # set of strings that is safe to intern
+        endpoint = sys.intern(endpoint)
 
     # Pre-populate audit info with request details (token_id will be set if auth succeeds)
     request.state.pat_audit_info = {
@@ -117,8 +146,9 @@ async def get_current_token_from_pat(
         await _set_audit_info_for_failed_auth(session, pat_token, "Token expired", request)
         raise
     except InvalidTokenException as e:
-        # Token not found or invalid
-        await _set_audit_info_for_failed_auth(session, pat_token, "Invalid token", request)
+        # Token not found or invalid; a malformed token has no row to attribute the attempt to
+        if validate_token_format(pat_token):
+            await _set_audit_info_for_failed_auth(session, pat_token, "Invalid token", request)
         raise
 
 
@@ -1,4 +1,6 @@
 """FCS (Flow Cytometry Standard) file management API endpoints."""
+from typing import Literal
+
 from fastapi import APIRouter, Depends, Query, Request, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -77,6 +79,7 @@ async def get_fcs_events(
     token_user: CurrentTokenUser,
     limit: int = Query(default=100, ge=1, le=10000),
     offset: int = Query(default=0, ge=0),
+    orient: Literal["records", "columns"] = Query(default="records"),
     session: AsyncSession = Depends(get_db),
 ):
     """Get FCS file event data from latest uploaded file.
@@ -86,6 +89,8 @@ async def get_fcs_events(
     Args:
         limit: Maximum number of events to return (1-10000)
         offset: Number of events to skip
+        orient: "records" (one dict per event) or "columns" (parameter names
+            listed once, events as value lists)
         token_user: Current token and user
         session: Database session
 
@@ -94,7 +99,7 @@ async def get_fcs_events(
     """
     token, user = token_user
     usecase = FCSUsecase(session)
-    result = await usecase.get_events(token.scopes, limit=limit, offset=offset)
+    result = await usecase.get_events(token.scopes, limit=limit, offset=offset, orient=orient)
     return success_response(result)
 
 
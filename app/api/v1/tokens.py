@@ -2,6 +2,7 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.database import get_db
@@ -43,19 +44,23 @@ async def create_token(
 async def list_tokens(
     request: Request,
     current_user: CurrentUser,
+    limit: int | None = Query(default=None, ge=1, le=1000),
+    cursor: str | None = Query(default=None),
     session: AsyncSession = Depends(get_db),
 ):
-    """List all tokens for current user.
+    """List tokens for current user, newest first.
 
     Args:
         current_user: Current authenticated user
+        limit: Maximum number of tokens per page (1-1000, all if omitted)
+        cursor: next_cursor from the previous page
         session: Database session
 
     Returns:
         Success response with list of tokens (without full token)
     """
     usecase = TokenUsecase(session)
-    tokens = await usecase.list_tokens(current_user.id)
+    tokens = await usecase.list_tokens(current_user.id, limit=limit, cursor=cursor)
     return success_response(tokens.model_dump())
 
 
@@ -105,7 +110,7 @@ async def revoke_token(
     return success_response(token.model_dump())
 
 
-@router.get("/tokens/{token_id}/logs", response_model=dict)
+@router.get("/tokens/{token_id}/logs", response_model=dict, response_class=ORJSONResponse)
 @limiter.shared_limit(RATE_LIMIT, scope="global")
 async def get_token_logs(
     request: Request,
@@ -113,6 +118,7 @@ async def get_token_logs(
     current_user: CurrentUser,
     limit: int = Query(default=100, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
     session: AsyncSession = Depends(get_db),
 ):
     """Get audit logs for a token.
@@ -121,12 +127,16 @@ async def get_token_logs(
         token_id: Token UUID
         current_user: Current authenticated user
         limit: Maximum number of logs to return (1-1000)
-        offset: Number of logs to skip
+        offset: Number of logs to skip (ignored when cursor is given)
+        cursor: next_cursor from the previous page
         session: Database session
 
     Returns:
-        Success response with audit logs
+        Success response with audit logs (serialized directly by orjson;
+        pages of up to 1000 rows skip jsonable_encoder)
     """
     usecase = TokenUsecase(session)
-    logs = await usecase.get_token_logs(current_user.id, token_id, limit=limit, offset=offset)
-    return success_response(logs)
+    logs = await usecase.get_token_logs(
+        current_user.id, token_id, limit=limit, offset=offset, cursor=cursor
+    )
+    return ORJSONResponse(success_response(logs))
@@ -43,7 +43,7 @@ class AuditLogMiddleware(BaseHTTPMiddleware):
                     else:
                         reason = f"HTTP {response.status_code}"
 
-            # Log audit entry directly (ensure it's written before response)
+            # Queue audit entry; it is written in a batch by the audit log consumer
             await self._log_audit(
                 session=pat_audit_info["session"],
                 token_id=pat_audit_info["token_id"],
@@ -61,7 +61,7 @@ class AuditLogMiddleware(BaseHTTPMiddleware):
         self,
         session,
         token_id,
-        ip_address: str,
+        ip_address: str | None,
         method: str,
         endpoint: str,
         status_code: int,
@@ -70,13 +70,14 @@ class AuditLogMiddleware(BaseHTTPMiddleware):
     ):
         """Log audit entry using token usecase.
 
-        This method is called asynchronously after the response is sent.
-        It uses the same session from the request but in a new transaction.
+        This method is called after the response is generated. The entry
+        is only queued here; it is persisted by the background audit log
+        consumer.
 
         Args:
             session: Database session from request
             token_id: Token UUID
-            ip_address: Client IP
+            ip_address: Client IP (None if unknown)
             method: HTTP method
             endpoint: API endpoint
             status_code: HTTP status code
@@ -0,0 +1,64 @@
+"""Monthly partition maintenance for the audit_logs table."""
+import logging
+from datetime import date, datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.common.database import engine
+
+logger = logging.getLogger(__name__)
+
+# Months after the current one to create partitions for in advance
+AUDIT_LOG_PARTITION_MONTHS_AHEAD = 2
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Name of the audit_logs partition holding the given month.
+
+    Args:
+        month: Any date within the month
+
+    Returns:
+        Partition table name, e.g. audit_logs_y2025m01
+    """
+    return f"audit_logs_y{month.year}m{month.month:02d}"
+
+
+async def ensure_audit_log_partitions(
+    db_engine: AsyncEngine = engine,
+    months_ahead: int = AUDIT_LOG_PARTITION_MONTHS_AHEAD,
+    today: date | None = None,
+) -> None:
+    """Create the monthly audit_logs partitions for this month and the next ones.
+
+    Existing partitions are left alone. Retention is a matter of dropping
+    old partitions (DROP TABLE audit_logs_y2025m01) instead of DELETEs.
+
+    Args:
+        db_engine: Engine to run the DDL on
+        months_ahead: Number of months after the current one to cover
+        today: Reference date (defaults to the current UTC date)
+    """
+    month = (today or datetime.now(timezone.utc).date()).replace(day=1)
+
+    for _ in range(months_ahead + 1):
+        next_month = _next_month(month)
+        try:
+            async with db_engine.begin() as conn:
+                await conn.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {partition_name(month)} "
+                    f"PARTITION OF audit_logs "
+                    f"FOR VALUES FROM ('{month.isoformat()} 00:00+00') "
+                    f"TO ('{next_month.isoformat()} 00:00+00')"
+                ))
+        except DBAPIError as e:
+            # Fails if the default partition already holds rows for the
+            # month; they stay there and the app keeps working
+            logger.warning(f"Could not create audit log partition {partition_name(month)}: {e}")
+        month = next_month
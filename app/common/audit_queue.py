@@ -0,0 +1,217 @@
+"""In-process queue that batches audit log inserts."""
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.database import async_session_maker
+from app.repository.audit_log_repository import AuditLogRepository
+
+logger = logging.getLogger(__name__)
+
+# Maximum seconds a queued entry waits before its batch is written
+AUDIT_LOG_FLUSH_INTERVAL = 0.1
+
+# Marker put on the queue by close() to stop the consumer after draining
+_STOP = object()
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class AuditLogQueue:
+    """Bounded queue of pending audit log rows written in batches.
+
+    Producers enqueue rows with put(); a single consumer task started with
+    run() writes up to `batch_size` rows per statement. put() never
+    waits: when the queue is full the oldest pending row is dropped, so a
+    slow or unavailable database cannot stall the requests being audited.
+    """
+
+    def __init__(self, maxsize: int = 10000, batch_size: int = 500):
+        self.batch_size = batch_size
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        # Rows discarded because the queue was full
+        self.dropped = 0
+        # Rows the database rejected or that could not be written at all
+        self.failed = 0
+        self._running = False
+        # Entries queued / handled so far, so flush() can wait for a prefix
+        self._queued = 0
+        self._handled = 0
+        self._handled_changed = asyncio.Condition()
+
+    async def put(
+        self,
+        token_id: UUID,
+        ip_address: str | None,
+        method: str,
+        endpoint: str,
+        status_code: int,
+        authorized: bool,
+        reason: str | None = None,
+    ) -> None:
+        """Queue an audit log entry, stamped with the current time.
+
+        The time is kept as time.time_ns() and only turned into a datetime
+        when the batch is written, off the request path.
+
+        Args:
+            token_id: Token UUID
+            ip_address: Client IP address (None if unknown)
+            method: HTTP method
+            endpoint: API endpoint
+            status_code: HTTP status code
+            authorized: Whether request was authorized
+            reason: Failure reason (if not authorized)
+        """
+        row = {
+            "token_id": token_id,
+            "timestamp": time.time_ns(),
+            "ip_address": ip_address,
+            "method": method,
+            "endpoint": endpoint,
+            "status_code": status_code,
+            "authorized": authorized,
+            "reason": reason,
+        }
+        self._queued += 1
+
+        if not self._queue.full():
+            self._queue.put_nowait(row)
+            return
+
+        # Drop the oldest row; it counts as handled so flush() still returns
+        self._queue.get_nowait()
+        self._queue.put_nowait(row)
+        self.dropped += 1
+        logger.warning(f"Audit log queue full, dropped oldest entry ({self.dropped} so far)")
+        async with self._handled_changed:
+            self._handled += 1
+            self._handled_changed.notify_all()
+
+    async def run(
+        self,
+        session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
+        flush_interval: float = AUDIT_LOG_FLUSH_INTERVAL,
+    ) -> None:
+        """Write queued rows in batches until close() is called.
+
+        A batch is written once it reaches `batch_size` rows or
+        `flush_interval` seconds after its first row was taken.
+
+        Args:
+            session_maker: Session factory to use
+            flush_interval: Maximum seconds to wait while filling a batch
+        """
+        loop = asyncio.get_running_loop()
+        self._running = True
+
+        try:
+            while not await self._write_next_batch(loop, session_maker, flush_interval):
+                pass
+        finally:
+            self._running = False
+            async with self._handled_changed:
+                self._handled_changed.notify_all()
+
+    async def _write_next_batch(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        session_maker: async_sessionmaker[AsyncSession],
+        flush_interval: float,
+    ) -> bool:
+        """Collect and write one batch; return True once close() was seen."""
+        row = await self._queue.get()
+        if row is _STOP:
+            return True
+
+        batch = [row]
+        stopping = False
+        deadline = loop.time() + flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                row = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if row is _STOP:
+                stopping = True
+                break
+            batch.append(row)
+
+        await self._write(session_maker, batch)
+
+        async with self._handled_changed:
+            self._handled += len(batch)
+            self._handled_changed.notify_all()
+        return stopping
+
+    async def flush(self) -> None:
+        """Wait until every entry queued so far has been written.
+
+        Returns immediately when no consumer is running, since nothing
+        would ever drain the queue.
+        """
+        if not self._running:
+            return
+        target = self._queued
+        async with self._handled_changed:
+            await self._handled_changed.wait_for(
+                lambda: self._handled >= target or not self._running
+            )
+
+    async def close(self) -> None:
+        """Ask the consumer to stop once everything queued so far is written."""
+        await self._queue.put(_STOP)
+
+    async def _write(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        batch: list[dict],
+    ) -> None:
+        for row in batch:
+            row["timestamp"] = _EPOCH + timedelta(microseconds=row["timestamp"] // 1000)
+        await self._insert(session_maker, batch)
+
+    async def _insert(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        rows: list[dict],
+    ) -> None:
+        """Insert rows in one transaction, bisecting on failure.
+
+        A row the database rejects fails its whole statement, so a failed
+        batch is split in half and each half retried until only the
+        offending rows are left; those are counted in `failed`. Connection
+        errors fail every row alike and drop the batch without retrying.
+        """
+        try:
+            async with session_maker() as session:
+                async with session.begin():
+                    await AuditLogRepository(session).create_many(rows)
+            return
+        except Exception as e:
+            # Audit logging is best effort; never let a failed batch stop the consumer
+            connection_lost = isinstance(e, OSError) or (
+                isinstance(e, DBAPIError) and e.connection_invalidated
+            )
+            if len(rows) == 1 or connection_lost:
+                self.failed += len(rows)
+                logger.error(
+                    f"Failed to write {len(rows)} audit log entries "
+                    f"({self.failed} so far): {e}"
+                )
+                return
+
+        middle = len(rows) // 2
+        await self._insert(session_maker, rows[:middle])
+        await self._insert(session_maker, rows[middle:])
+
+
+audit_log_queue = AuditLogQueue()
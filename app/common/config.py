@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from pydantic import field_validator
+from pydantic import Field, field_validator
 import json
 
 
@@ -15,6 +15,9 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    db_pool_size: int = 20
+    db_max_overflow: int = 0
+    db_pool_recycle: int = 3600  # seconds
 
     # JWT Security
     jwt_secret_key: str
@@ -24,6 +27,16 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_per_minute: int = 60
 
+    # PAT lookup cache (0 TTL disables it)
+    token_cache_size: int = 10000
+    token_cache_ttl: float = 30.0  # seconds; bounds how long another process may accept a revoked token
+
+    # FCS file storage
+    upload_dir: str = "uploads"
+
+    # FCS statistics worker processes, per application process
+    statistics_workers: int = Field(default=2, ge=1)
+
     # CORS
     cors_origins: list[str] | str = '["http://localhost:3000","http://localhost:8000"]'
 
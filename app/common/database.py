@@ -1,4 +1,12 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+import asyncio
+from contextlib import asynccontextmanager
+
+from sqlalchemy.ext.asyncio import (
+    create_async_engine,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+)
 from sqlalchemy.orm import declarative_base
 from app.common.config import settings
 
@@ -7,6 +15,9 @@ engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     future=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle,
 )
 
 # Create async session factory
@@ -30,12 +41,49 @@ async def get_db() -> AsyncSession:
         yield session
 
 
+@asynccontextmanager
+async def autocommit_read(session: AsyncSession):
+    """Scope a read-only block without BEGIN/COMMIT round-trips.
+
+    Drop-in replacement for 'async with session.begin():' around pure
+    SELECTs. The session's connection runs in AUTOCOMMIT for the block, so
+    each statement is its own implicit transaction on the server. The
+    isolation level is reset when the connection returns to the pool.
+    """
+    async with session.begin():
+        await session.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+        yield
+
+
 async def init_db():
     """Initialize database tables."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def warm_up_pool(
+    db_engine: AsyncEngine = engine, size: int = settings.db_pool_size
+) -> None:
+    """Open `size` pooled connections up front so first requests skip connection setup.
+
+    The connections are opened concurrently and returned to the pool
+    immediately.
+
+    Args:
+        db_engine: Engine whose pool to fill
+        size: Number of connections to open (at most the pool size)
+    """
+    connections = await asyncio.gather(
+        *(db_engine.connect() for _ in range(size)), return_exceptions=True
+    )
+    for conn in connections:
+        if not isinstance(conn, BaseException):
+            await conn.close()
+    for conn in connections:
+        if isinstance(conn, BaseException):
+            raise conn
+
+
 async def close_db():
     """Close database connections."""
     await engine.dispose()
@@ -0,0 +1,40 @@
+"""Background flushing of buffered token last-used timestamps."""
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.database import async_session_maker
+from app.repository.token_repository import TokenRepository
+
+logger = logging.getLogger(__name__)
+
+# Seconds between batched last_used_at writes
+LAST_USED_FLUSH_INTERVAL = 1.0
+
+
+async def flush_last_used(
+    session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
+) -> int:
+    """Write all buffered last used timestamps in one transaction.
+
+    Args:
+        session_maker: Session factory to use
+
+    Returns:
+        Number of tokens updated
+    """
+    async with session_maker() as session:
+        async with session.begin():
+            return await TokenRepository(session).flush_last_used()
+
+
+async def run_last_used_flusher(interval: float = LAST_USED_FLUSH_INTERVAL) -> None:
+    """Flush buffered last used timestamps every `interval` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await flush_last_used()
+        except Exception as e:
+            # Don't let a failed flush stop the loop; entries are retried next time
+            logger.error(f"Failed to flush token last_used_at: {e}")
@@ -0,0 +1,55 @@
+"""Process-local cache of PAT lookups."""
+import time
+from collections import OrderedDict
+
+from app.common.config import settings
+from app.models.token import Token
+from app.models.user import User
+
+
+class TokenCache:
+    """LRU cache of (Token, User) pairs keyed by token hash, with a TTL.
+
+    Saves the token lookup query for repeated requests with the same PAT.
+    Entries are detached ORM objects and are only read. A revocation made
+    by this process evicts the entry right away; one made by another
+    process is picked up once the entry expires, after at most `ttl`
+    seconds.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[bytes, tuple[float, Token, User]] = OrderedDict()
+
+    def get(self, token_hash: bytes) -> tuple[Token, User] | None:
+        """Return the cached pair for a token hash, or None if absent or expired."""
+        entry = self._entries.get(token_hash)
+        if entry is None:
+            return None
+        expires, token, user = entry
+        if time.monotonic() >= expires:
+            del self._entries[token_hash]
+            return None
+        self._entries.move_to_end(token_hash)
+        return token, user
+
+    def set(self, token_hash: bytes, token: Token, user: User) -> None:
+        """Cache a pair, evicting the least recently used entry when full."""
+        if self.ttl <= 0:
+            return
+        self._entries[token_hash] = (time.monotonic() + self.ttl, token, user)
+        self._entries.move_to_end(token_hash)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, token_hash: bytes) -> None:
+        """Drop the entry for a token hash, if cached."""
+        self._entries.pop(token_hash, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+token_cache = TokenCache(maxsize=settings.token_cache_size, ttl=settings.token_cache_ttl)
@@ -0,0 +1,44 @@
+"""Opaque cursors for keyset pagination."""
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+
+def encode_cursor(sort_value: datetime, row_id: UUID) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor.
+
+    Args:
+        sort_value: Timestamp the listing is ordered by
+        row_id: Row UUID (tie-breaker for equal timestamps)
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{sort_value.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        Tuple of (sort_value, row_id)
+
+    Raises:
+        ValueError: If cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        sort_value, row_id = raw.split("|")
+        parsed = datetime.fromisoformat(sort_value), UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    if parsed[0].tzinfo is None:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return parsed
@@ -1,5 +1,7 @@
 """Permission system with hierarchical scopes."""
 from enum import Enum
+from functools import lru_cache, reduce
+from operator import or_
 from typing import Any
 
 
@@ -60,14 +62,58 @@ PERMISSION_HIERARCHY: dict[str, dict[str, list[str]]] = {
 }
 
 
+# Precomputed permissions implied by each known (resource, permission) pair,
+# including the permission itself. Built once at import time.
+IMPLIED_PERMISSIONS: dict[tuple[str, str], frozenset[str]] = {
+    (resource.value, permission.value): frozenset(
+        [permission.value, *(implied.value for implied in implied_permissions)]
+    )
+    for resource, resource_hierarchy in PERMISSION_HIERARCHY.items()
+    for permission, implied_permissions in resource_hierarchy.items()
+}
+
+
 def format_scope(resource: str, permission: str) -> str:
     """Format a scope string (e.g., 'workspacess:read')."""
     return f"{resource}:{permission}"
 
 
+# One bit per known scope, and for each scope the mask of every scope it
+# grants (itself included). Built once at import time.
+SCOPE_BITS: dict[str, int] = {
+    format_scope(resource, permission): 1 << bit
+    for bit, (resource, permission) in enumerate(IMPLIED_PERMISSIONS)
+}
+SCOPE_MASKS: dict[str, int] = {
+    format_scope(resource, permission): reduce(
+        or_, (SCOPE_BITS[format_scope(resource, implied)] for implied in implied_permissions)
+    )
+    for (resource, permission), implied_permissions in IMPLIED_PERMISSIONS.items()
+}
+
+
+@lru_cache(maxsize=4096)
+def scope_mask(scopes: tuple[str, ...]) -> int:
+    """OR together the masks of the given scopes; unknown scopes grant nothing.
+
+    Memoized per scope tuple, so each token's mask is computed once.
+
+    Example:
+        >>> scope_mask(('fcs:write',)) == SCOPE_BITS['fcs:write'] | SCOPE_BITS['fcs:read']
+        True
+    """
+    mask = 0
+    for scope in scopes:
+        mask |= SCOPE_MASKS.get(scope, 0)
+    return mask
+
+
+@lru_cache(maxsize=512)
 def parse_scope(scope: str) -> tuple[str, str]:
     """Parse a scope string into resource and permission.
 
+    Results are memoized since the same scope strings recur across requests.
+
     Args:
         scope: Scope string (e.g., 'workspacess:read')
 
@@ -83,34 +129,94 @@ def parse_scope(scope: str) -> tuple[str, str]:
     return parts[0], parts[1]
 
 
-def get_implied_permissions(resource: str, permission: str) -> list[str]:
+@lru_cache(maxsize=512)
+def get_implied_permissions(resource: str, permission: str) -> frozenset[str]:
     """Get all permissions implied by the given permission (including itself).
 
+    Results are memoized and immutable, so callers share one cached set.
+
     Args:
         resource: Resource type (e.g., 'workspacess')
         permission: Permission level (e.g., 'admin')
 
     Returns:
-        List of all implied permissions including the given one
+        Frozenset of all implied permissions including the given one
 
     Example:
-        >>> get_implied_permissions('workspacess', 'admin')
-        ['admin', 'delete', 'write', 'read']
+        >>> sorted(get_implied_permissions('workspacess', 'admin'))
+        ['admin', 'delete', 'read', 'write']
     """
-    if resource not in PERMISSION_HIERARCHY:
-        return [permission]
+    implied_permissions = IMPLIED_PERMISSIONS.get((resource, permission))
+    if implied_permissions is None:
+        return frozenset([permission])
+    return implied_permissions
+
+
+@lru_cache(maxsize=4096)
+def build_granted_index(scopes: tuple[str, ...]) -> dict[str, dict[str, str]]:
+    """Map each granted (resource, permission) to the scope that grants it.
+
+    Built in one pass over the scopes and memoized per scope tuple, so
+    repeated checks for the same token are dictionary lookups. When several
+    scopes grant a permission, the first one in `scopes` wins. The returned
+    dict is shared between callers and must not be mutated.
+
+    Args:
+        scopes: Granted scopes, in the order they were issued
 
-    resource_hierarchy = PERMISSION_HIERARCHY[resource]
-    if permission not in resource_hierarchy:
-        return [permission]
+    Returns:
+        Dict of {resource: {permission: granting_scope}}
 
-    # Return the permission itself plus all its implied permissions
-    return [permission] + resource_hierarchy[permission]
+    Example:
+        >>> build_granted_index(('fcs:write',))
+        {'fcs': {'write': 'fcs:write', 'read': 'fcs:write'}}
+    """
+    index: dict[str, dict[str, str]] = {}
+    for scope in scopes:
+        try:
+            resource, permission = parse_scope(scope)
+        except ValueError:
+            continue
+
+        granted = index.setdefault(resource, {})
+        for implied in IMPLIED_PERMISSIONS.get((resource, permission), (permission,)):
+            granted.setdefault(implied, scope)
+    return index
+
+
+def find_granted_by(user_scopes: list[str], required_scope: str) -> str | None:
+    """Find which scope granted the required permission.
+
+    A scope matching the requirement exactly is the common case and wins
+    outright; otherwise the first scope implying it is returned.
+
+    Args:
+        user_scopes: User's granted scopes
+        required_scope: Required scope
+
+    Returns:
+        The scope that granted the permission, or None
+    """
+    if required_scope in user_scopes:
+        return required_scope
+
+    try:
+        required_resource, required_permission = parse_scope(required_scope)
+    except ValueError:
+        return None
+
+    return (
+        build_granted_index(tuple(user_scopes))
+        .get(required_resource, {})
+        .get(required_permission)
+    )
 
 
 def has_permission(user_scopes: list[str], required_scope: str) -> bool:
     """Check if user has the required permission.
 
+    Only known scopes (see validate_scope) can grant or be granted.
+
     Args:
         user_scopes: List of scopes the user has (e.g., ['workspacess:admin', 'fcs:read'])
         required_scope: The required scope (e.g., 'workspacess:write')
@@ -124,30 +230,10 @@ def has_permission(user_scopes: list[str], required_scope: str) -> bool:
         >>> has_permission(['workspacess:read'], 'workspacess:write')
         False
     """
-    try:
-        required_resource, required_permission = parse_scope(required_scope)
-    except ValueError:
+    required_bit = SCOPE_BITS.get(required_scope)
+    if required_bit is None:
         return False
-
-    # Check each user scope
-    for scope in user_scopes:
-        try:
-            resource, permission = parse_scope(scope)
-        except ValueError:
-            continue
-
-        # Only check scopes for the same resource
-        if resource != required_resource:
-            continue
-
-        # Get all permissions implied by this scope
-        implied_permissions = get_implied_permissions(resource, permission)
-
-        # Check if required permission is in the implied permissions
-        if required_permission in implied_permissions:
-            return True
-
-    return False
+    return bool(scope_mask(tuple(user_scopes)) & required_bit)
 
 
 def validate_scope(scope: str) -> bool:
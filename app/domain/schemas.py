@@ -102,6 +102,7 @@ class TokenListResponse(BaseModel):
 
     tokens: list[TokenListItem]
     total: int
+    next_cursor: str | None = None  # Pass as `cursor` to fetch the next page
 
 
 class TokenDetailResponse(BaseModel):
@@ -127,7 +128,7 @@ class AuditLogItem(BaseModel):
     """Single audit log entry."""
 
     timestamp: datetime
-    ip: str
+    ip: str | None
     method: str
     endpoint: str
     status_code: int
@@ -140,7 +141,8 @@ class AuditLogResponse(BaseModel):
 
     token_id: UUID
     token_name: str
-    total_logs: int
+    total_logs: int  # capped at TOTAL_COUNT_CAP when total_logs_exact is false
+    total_logs_exact: bool
     logs: list[AuditLogItem]
 
 
@@ -10,6 +10,7 @@ from datetime import datetime, timedelta, timezone
 TOKEN_PREFIX = "pat_"
 TOKEN_RANDOM_LENGTH = 32  # Length of random part (after prefix)
 TOKEN_CHARSET = string.ascii_letters + string.digits  # a-zA-Z0-9
+_TOKEN_CHARS = frozenset(TOKEN_CHARSET)
 
 
 @dataclass
@@ -17,7 +18,7 @@ class TokenInfo:
     """Information about a generated token (returned only once at creation)."""
 
     full_token: str  # Only shown once
-    token_hash: str  # Stored in database
+    token_hash: bytes  # Stored in database
     token_prefix: str  # Stored in database for display
 
 
@@ -36,16 +37,19 @@ def generate_pat_token() -> str:
     return TOKEN_PREFIX + random_part
 
 
-def hash_token(token: str) -> str:
+def hash_token(token: str) -> bytes:
     """Hash a token using SHA-256.
 
+    Tokens carry 32 random characters, so a fast unsalted hash is enough and
+    the hash can be looked up directly through the unique index.
+
     Args:
         token: The full token string to hash
 
     Returns:
-        Hexadecimal string of the hash (64 characters)
+        Raw 32-byte digest (stored as bytea, half the size of hex text)
     """
-    return hashlib.sha256(token.encode()).hexdigest()
+    return hashlib.sha256(token.encode()).digest()
 
 
 def extract_token_prefix(token: str) -> str:
@@ -93,7 +97,7 @@ def validate_token_format(token: str) -> bool:
 
     # Check that random part only contains valid characters
     random_part = token[len(TOKEN_PREFIX) :]
-    return all(c in TOKEN_CHARSET for c in random_part)
+    return _TOKEN_CHARS.issuperset(random_part)
 
 
 def calculate_expiry_date(days: int | None = None) -> datetime:
@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import os
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,12 +10,16 @@ from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 
 from app.common.config import settings
-from app.common.database import init_db, close_db, async_session_maker
+from app.common.database import init_db, close_db, warm_up_pool, async_session_maker
 from app.common.exceptions import AppException, UnauthorizedException
 from app.common.responses import error_response
 from app.common.rate_limit import limiter
 from app.common.audit_middleware import AuditLogMiddleware
+from app.common.audit_partitions import ensure_audit_log_partitions
+from app.common.audit_queue import audit_log_queue
 from app.common.startup import initialize_sample_fcs_file
+from app.common.last_used_flusher import flush_last_used, run_last_used_flusher
+from app.usecase.fcs_usecase import start_statistics_pool, shutdown_statistics_pool
 
 
 # Configure logging
@@ -28,15 +34,41 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
+    # Create upload directory once instead of on every FCSUsecase construction
+    os.makedirs(settings.upload_dir, exist_ok=True)
+
     await init_db()
+    await ensure_audit_log_partitions()
+    await warm_up_pool()
+
+    # Worker processes for FCS statistics
+    start_statistics_pool()
 
     # Initialize sample FCS file if needed
     async with async_session_maker() as session:
         await initialize_sample_fcs_file(session)
 
+    # Periodically persist buffered token last_used_at timestamps
+    last_used_task = asyncio.create_task(run_last_used_flusher())
+
+    # Write queued audit log entries in batches
+    audit_log_task = asyncio.create_task(audit_log_queue.run())
+
     yield
 
     # Shutdown
+    # Drain entries queued by the last requests before closing the engine
+    await audit_log_queue.close()
+    await audit_log_task
+
+    last_used_task.cancel()
+    try:
+        await last_used_task
+    except asyncio.CancelledError:
+        pass
+    await flush_last_used()
+
+    shutdown_statistics_pool()
     await close_db()
 
 
@@ -1,27 +1,69 @@
 """Audit log model."""
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Integer, text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import DDL, Column, String, DateTime, Boolean, Enum, ForeignKey, Index, Integer, event, text
+from sqlalchemy.dialects.postgresql import INET, UUID
 from sqlalchemy.orm import relationship
 from app.common.database import Base
 from app.common.id_utils import generate_uuid7
 
+# Methods the API routes accept; stored as a Postgres enum (4 bytes per row)
+HTTP_METHOD_VALUES = ("GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS")
+
 
 class AuditLog(Base):
-    """Audit log for token usage."""
+    """Audit log for token usage.
+
+    The table is range-partitioned by month on timestamp (see
+    app.common.audit_partitions), so the partition key is part of the
+    primary key.
+    """
     __tablename__ = "audit_logs"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=generate_uuid7)
     token_id = Column(UUID(as_uuid=True), ForeignKey("tokens.id", ondelete="CASCADE"), nullable=False)
-    timestamp = Column(DateTime(timezone=True), nullable=False, server_default=text("CURRENT_TIMESTAMP"), index=True)
-    ip_address = Column(String(45), nullable=False)  # IPv6 compatible
-    method = Column(String(10), nullable=False)  # GET, POST, etc.
+    timestamp = Column(DateTime(timezone=True), primary_key=True, nullable=False, server_default=text("CURRENT_TIMESTAMP"), index=True)
+    ip_address = Column(INET, nullable=True)  # IPv4 or IPv6; NULL if the client address is unknown
+    method = Column(Enum(*HTTP_METHOD_VALUES, name="http_method"), nullable=False)
     endpoint = Column(String(255), nullable=False)
     status_code = Column(Integer, nullable=False)
     authorized = Column(Boolean, nullable=False)
     reason = Column(String(255), nullable=True)  # Failure reason if not authorized
 
+    __table_args__ = (
+        # Token log listing (newest first); the included columns let a page
+        # be read from the index alone
+        Index(
+            "idx_audit_logs_token_ts",
+            token_id,
+            timestamp.desc(),
+            id.desc(),
+            postgresql_include=["ip_address", "method", "endpoint", "status_code", "authorized", "reason"],
+        ),
+        # Recent failed requests across all tokens
+        Index(
+            "idx_audit_logs_ts_unauthorized",
+            timestamp.desc(),
+            postgresql_where=text("authorized = false"),
+        ),
+        # Client address and subnet lookups (ip_address << '10.0.0.0/8')
+        Index(
+            "idx_audit_logs_ip",
+            ip_address,
+            postgresql_using="gist",
+            postgresql_ops={"ip_address": "inet_ops"},
+        ),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
+
     # Relationships
     token = relationship("Token", back_populates="audit_logs")
 
     def __repr__(self):
         return f"<AuditLog(id={self.id}, token_id={self.token_id}, endpoint={self.endpoint})>"
+
+
+# Rows outside every monthly partition land here, so inserts never fail
+event.listen(
+    AuditLog.__table__,
+    "after_create",
+    DDL("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT"),
+)
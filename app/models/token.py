@@ -1,5 +1,5 @@
 """Token model."""
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, JSON, text
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, JSON, LargeBinary, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.common.database import Base
@@ -13,7 +13,7 @@ class Token(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=generate_uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(100), nullable=False)
-    token_hash = Column(String(64), nullable=False, unique=True, index=True)  # SHA-256 hash
+    token_hash = Column(LargeBinary(32), nullable=False, unique=True, index=True)  # SHA-256 digest
     token_prefix = Column(String(12), nullable=False, index=True)  # pat_ + first 8 chars
     scopes = Column(JSON, nullable=False, default=list)  # ["workspacess:read", "fcs:write", ...]
     expires_at = Column(DateTime(timezone=True), nullable=False)
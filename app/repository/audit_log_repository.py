@@ -1,11 +1,32 @@
 """Audit log repository for database operations."""
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select, func
+from sqlalchemy import select, func, insert, literal, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.id_utils import generate_uuid7
 from app.models.audit_log import AuditLog
 
+# Batches at least this large are written with COPY instead of INSERT
+COPY_THRESHOLD = 100
+
+# Token log listings count at most this many rows for their total
+TOTAL_COUNT_CAP = 10000
+
+# Column order of the records passed to COPY
+_COPY_COLUMNS = (
+    "id",
+    "token_id",
+    "timestamp",
+    "ip_address",
+    "method",
+    "endpoint",
+    "status_code",
+    "authorized",
+    "reason",
+)
+
 
 class AuditLogRepository:
     """Repository for AuditLog model operations."""
@@ -16,7 +37,7 @@ class AuditLogRepository:
     async def create(
         self,
         token_id: UUID,
-        ip_address: str,
+        ip_address: str | None,
         method: str,
         endpoint: str,
         status_code: int,
@@ -27,7 +48,7 @@ class AuditLogRepository:
 
         Args:
             token_id: Token UUID
-            ip_address: Client IP address
+            ip_address: Client IP address (None if unknown)
             method: HTTP method
             endpoint: API endpoint
             status_code: HTTP status code
@@ -51,6 +72,33 @@ class AuditLogRepository:
         await self.session.refresh(log)
         return log
 
+    async def create_many(self, rows: list[dict]) -> None:
+        """Insert several audit log entries in one statement.
+
+        Batches of COPY_THRESHOLD rows or more are streamed with COPY, which
+        skips per-row parsing and planning; smaller ones use a multi-row
+        INSERT.
+
+        Args:
+            rows: Column values for each entry, keyed by column name
+        """
+        if not rows:
+            return
+        if len(rows) < COPY_THRESHOLD:
+            await self.session.execute(insert(AuditLog), rows)
+            return
+
+        # COPY bypasses SQLAlchemy, so generate the client-side ids here
+        records = [
+            (generate_uuid7(), *(row[column] for column in _COPY_COLUMNS[1:]))
+            for row in rows
+        ]
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            AuditLog.__tablename__, records=records, columns=_COPY_COLUMNS
+        )
+
     async def get_by_id(self, log_id: UUID) -> AuditLog | None:
         """Get audit log by ID.
 
@@ -70,25 +118,34 @@ class AuditLogRepository:
         token_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        after: tuple[datetime, UUID] | None = None,
     ) -> tuple[list[AuditLog], int]:
-        """List audit logs for a token.
+        """List audit logs for a token, newest first.
+
+        When `after` is given, the page continues after that (timestamp, id)
+        sort key using keyset pagination and `offset` is ignored.
 
         Args:
             token_id: Token UUID
             limit: Maximum number of logs to return
             offset: Number of logs to skip
+            after: Sort key to continue after (exclusive)
 
         Returns:
             Tuple of (list of AuditLog objects, total count)
         """
         # Get logs
-        result = await self.session.execute(
+        stmt = (
             select(AuditLog)
             .where(AuditLog.token_id == token_id)
-            .order_by(AuditLog.timestamp.desc())
+            .order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())
             .limit(limit)
-            .offset(offset)
         )
+        if after is not None:
+            stmt = stmt.where(tuple_(AuditLog.timestamp, AuditLog.id) < after)
+        else:
+            stmt = stmt.offset(offset)
+        result = await self.session.execute(stmt)
         logs = list(result.scalars().all())
 
         # Get total count
@@ -99,6 +156,74 @@ class AuditLogRepository:
 
         return logs, total
 
+    async def list_by_token_projected(
+        self,
+        token_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> tuple[list[dict], int, bool]:
+        """List audit logs for a token as plain dicts, newest first.
+
+        Same paging as list_by_token, but selects only the columns the API
+        returns (keyed by their response field names, plus `id` for the
+        cursor) and skips ORM object hydration.
+
+        The total is exact up to TOTAL_COUNT_CAP rows. Past that the count
+        stops at the cap instead of scanning every log of a busy token.
+
+        Args:
+            token_id: Token UUID
+            limit: Maximum number of logs to return
+            offset: Number of logs to skip
+            after: Sort key to continue after (exclusive)
+
+        Returns:
+            Tuple of (list of log dicts, total count, whether total is exact)
+        """
+        stmt = (
+            select(
+                AuditLog.id,
+                AuditLog.timestamp,
+                # host() renders the inet value as plain text, without a mask
+                func.host(AuditLog.ip_address).label("ip"),
+                AuditLog.method,
+                AuditLog.endpoint,
+                AuditLog.status_code,
+                AuditLog.authorized,
+                AuditLog.reason,
+            )
+            .where(AuditLog.token_id == token_id)
+            .order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(AuditLog.timestamp, AuditLog.id) < after)
+        else:
+            stmt = stmt.offset(offset)
+        result = await self.session.execute(stmt)
+        logs = [dict(row) for row in result.mappings()]
+
+        # A short offset page reached the end, so the total is known without
+        # a COUNT; a cursor page can't tell how many rows came before it
+        if after is None and len(logs) < limit and (logs or offset == 0):
+            return logs, offset + len(logs), True
+
+        # Count at most TOTAL_COUNT_CAP + 1 rows; the extra row tells a token
+        # with exactly TOTAL_COUNT_CAP logs apart from one with more
+        capped = (
+            select(literal(1))
+            .where(AuditLog.token_id == token_id)
+            .limit(TOTAL_COUNT_CAP + 1)
+            .subquery()
+        )
+        count_result = await self.session.execute(
+            select(func.count()).select_from(capped)
+        )
+        total = count_result.scalar_one()
+
+        return logs, min(total, TOTAL_COUNT_CAP), total <= TOTAL_COUNT_CAP
+
     async def list_by_user_tokens(
         self,
         token_ids: list[UUID],
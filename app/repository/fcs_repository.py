@@ -1,7 +1,7 @@
 """FCS file repository for database operations."""
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -32,16 +32,18 @@ class FCSRepository:
         Returns:
             Created FCSFile object
         """
-        fcs_file = FCSFile(
-            filename=filename,
-            file_path=file_path,
-            total_events=total_events,
-            total_parameters=total_parameters,
+        # Single INSERT ... RETURNING round-trip (no flush + refresh SELECT)
+        result = await self.session.execute(
+            insert(FCSFile)
+            .values(
+                filename=filename,
+                file_path=file_path,
+                total_events=total_events,
+                total_parameters=total_parameters,
+            )
+            .returning(FCSFile)
         )
-        self.session.add(fcs_file)
-        await self.session.flush()
-        await self.session.refresh(fcs_file)
-        return fcs_file
+        return result.scalar_one()
 
     async def create_parameter(
         self,
@@ -2,17 +2,22 @@
 from datetime import datetime, timezone
 from uuid import UUID
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, update, bindparam, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError, OperationalError, DBAPIError
 
 from app.models.token import Token
+from app.models.user import User
 from .exceptions import (
-    DuplicateRecordException,
     DatabaseConnectionException,
     DatabaseOperationException,
 )
 
+# Pending last_used_at updates (token_id -> latest use time), written in
+# batches by flush_last_used() instead of one UPDATE per request
+_pending_last_used: dict[UUID, datetime] = {}
+
 
 class TokenRepository:
     """Repository for Token model operations."""
@@ -24,13 +29,17 @@ class TokenRepository:
         self,
         user_id: UUID,
         name: str,
-        token_hash: str,
+        token_hash: bytes,
         token_prefix: str,
         scopes: list[str],
         expires_at: datetime,
-    ) -> Token:
+    ) -> Token | None:
         """Create a new token.
 
+        Uses INSERT ... ON CONFLICT (token_hash) DO NOTHING RETURNING, so a
+        hash collision yields no row instead of an error that would abort
+        the transaction.
+
         Args:
             user_id: User UUID
             name: Token name
@@ -40,30 +49,28 @@ class TokenRepository:
             expires_at: Expiration datetime
 
         Returns:
-            Created Token object
+            Created Token object, or None if the token hash already exists
 
         Raises:
-            DuplicateRecordException: If token hash already exists
             DatabaseConnectionException: If database connection fails
             DatabaseOperationException: If database operation fails
         """
         try:
-            token = Token(
-                user_id=user_id,
-                name=name,
-                token_hash=token_hash,
-                token_prefix=token_prefix,
-                scopes=scopes,
-                expires_at=expires_at,
+            result = await self.session.execute(
+                pg_insert(Token)
+                .values(
+                    user_id=user_id,
+                    name=name,
+                    token_hash=token_hash,
+                    token_prefix=token_prefix,
+                    scopes=scopes,
+                    expires_at=expires_at,
+                )
+                .on_conflict_do_nothing(index_elements=[Token.token_hash])
+                .returning(Token)
             )
-            self.session.add(token)
-            await self.session.flush()
-            await self.session.refresh(token)
-            return token
+            return result.scalar_one_or_none()
         except IntegrityError as e:
-            error_msg = str(e.orig).lower()
-            if "unique" in error_msg and "token_hash" in error_msg:
-                raise DuplicateRecordException("Token hash collision detected")
             raise DatabaseOperationException("Failed to create token", detail=str(e.orig))
         except OperationalError as e:
             raise DatabaseConnectionException(detail=str(e.orig))
@@ -84,7 +91,7 @@ class TokenRepository:
         )
         return result.scalar_one_or_none()
 
-    async def get_by_hash(self, token_hash: str) -> Token | None:
+    async def get_by_hash(self, token_hash: bytes) -> Token | None:
         """Get token by hash.
 
         Args:
@@ -98,6 +105,23 @@ class TokenRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_token_with_user(self, token_hash: bytes) -> tuple[Token, User] | None:
+        """Get token and its owner by token hash in a single query.
+
+        Args:
+            token_hash: Token hash
+
+        Returns:
+            Tuple of (Token, User) if found, None otherwise
+        """
+        result = await self.session.execute(
+            select(Token, User)
+            .join(User, Token.user_id == User.id)
+            .where(Token.token_hash == token_hash)
+        )
+        row = result.one_or_none()
+        return (row.Token, row.User) if row else None
+
     async def get_by_prefix(self, token_prefix: str) -> list[Token]:
         """Get tokens by prefix.
 
@@ -112,20 +136,36 @@ class TokenRepository:
         )
         return list(result.scalars().all())
 
-    async def list_by_user(self, user_id: UUID) -> list[Token]:
-        """List all tokens for a user.
+    async def list_by_user(
+        self,
+        user_id: UUID,
+        after: tuple[datetime, UUID] | None = None,
+        limit: int | None = None,
+    ) -> list[Token]:
+        """List tokens for a user, newest first.
+
+        Uses keyset pagination: pass the (created_at, id) of the last token
+        of the previous page as `after` to continue from it.
 
         Args:
             user_id: User UUID
+            after: Sort key to continue after (exclusive)
+            limit: Maximum number of tokens to return (all if None)
 
         Returns:
             List of Token objects
         """
-        result = await self.session.execute(
+        stmt = (
             select(Token)
             .where(Token.user_id == user_id)
-            .order_by(Token.created_at.desc())
+            .order_by(Token.created_at.desc(), Token.id.desc())
         )
+        if after is not None:
+            stmt = stmt.where(tuple_(Token.created_at, Token.id) < after)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
     async def list_active_by_user(self, user_id: UUID) -> list[Token]:
@@ -167,21 +207,80 @@ class TokenRepository:
             await self.session.refresh(token)
         return token
 
-    async def update_last_used(self, token_id: UUID) -> Token | None:
-        """Update token's last used timestamp.
+    async def revoke_owned(self, token_id: UUID, user_id: UUID) -> Token | None:
+        """Revoke a token owned by the given user in a single UPDATE ... RETURNING.
 
         Args:
             token_id: Token UUID
+            user_id: Owner's User UUID
 
         Returns:
-            Updated Token object if found, None otherwise
+            Revoked Token object if a token with this ID belongs to the user,
+            None otherwise
         """
-        token = await self.get_by_id(token_id)
-        if token:
-            token.last_used_at = datetime.now(timezone.utc)
-            await self.session.flush()
-            await self.session.refresh(token)
-        return token
+        result = await self.session.execute(
+            update(Token)
+            .where(Token.id == token_id, Token.user_id == user_id)
+            .values(is_revoked=True)
+            .returning(Token)
+        )
+        return result.scalar_one_or_none()
+
+    async def exists(self, token_id: UUID) -> bool:
+        """Check whether a token exists without loading it.
+
+        Args:
+            token_id: Token UUID
+
+        Returns:
+            True if the token exists, False otherwise
+        """
+        result = await self.session.execute(
+            select(Token.id).where(Token.id == token_id)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def update_last_used(self, token_id: UUID) -> None:
+        """Record token's last used timestamp.
+
+        No DB round-trip: the timestamp is buffered in memory and persisted
+        by flush_last_used() (run periodically in the background).
+
+        Args:
+            token_id: Token UUID
+        """
+        _pending_last_used[token_id] = datetime.now(timezone.utc)
+
+    async def flush_last_used(self) -> int:
+        """Persist buffered last used timestamps in a single batched UPDATE.
+
+        Returns:
+            Number of tokens updated
+        """
+        if not _pending_last_used:
+            return 0
+
+        pending = dict(_pending_last_used)
+        _pending_last_used.clear()
+
+        tokens = Token.__table__
+        try:
+            await self.session.execute(
+                update(tokens)
+                .where(tokens.c.id == bindparam("b_id"))
+                .values(last_used_at=bindparam("b_last_used_at")),
+                [
+                    {"b_id": token_id, "b_last_used_at": last_used_at}
+                    for token_id, last_used_at in pending.items()
+                ],
+            )
+        except Exception:
+            # Keep the timestamps for the next flush unless newer ones arrived
+            for token_id, last_used_at in pending.items():
+                _pending_last_used.setdefault(token_id, last_used_at)
+            raise
+
+        return len(pending)
 
     async def delete(self, token_id: UUID) -> bool:
         """Delete a token.
@@ -199,7 +298,7 @@ class TokenRepository:
             return True
         return False
 
-    async def is_valid(self, token_hash: str) -> tuple[bool, Token | None]:
+    async def is_valid(self, token_hash: bytes) -> tuple[bool, Token | None]:
         """Check if a token is valid (exists, not revoked, not expired).
 
         Args:
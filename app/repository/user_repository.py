@@ -3,6 +3,7 @@ from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 from sqlalchemy.exc import IntegrityError, OperationalError, DBAPIError
 
 from app.models.user import User
@@ -87,6 +88,25 @@ class UserRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_auth_row_by_username(self, username: str) -> User | None:
+        """Get only the columns needed to authenticate a user by username.
+
+        Only ``id`` and ``password_hash`` are loaded; accessing any other
+        attribute on the returned object is not supported.
+
+        Args:
+            username: Username
+
+        Returns:
+            Partially loaded User object if found, None otherwise
+        """
+        result = await self.session.execute(
+            select(User)
+            .options(load_only(User.id, User.password_hash))
+            .where(User.username == username)
+        )
+        return result.scalar_one_or_none()
+
     async def get_by_email(self, email: str) -> User | None:
         """Get user by email.
 
@@ -6,6 +6,8 @@ import jwt
 
 logger = logging.getLogger(__name__)
 
+from app.common.database import autocommit_read
+from app.common.token_cache import token_cache
 from app.common.exceptions import (
     UnauthorizedException,
     ValidationException,
@@ -16,7 +18,7 @@ from app.common.exceptions import (
     InvalidTokenException,
 )
 from app.domain.auth_service import hash_password, verify_password, create_access_token, extract_user_id_from_token
-from app.domain.token_service import hash_token
+from app.domain.token_service import hash_token, validate_token_format
 from app.domain.schemas import UserRegisterRequest, UserLoginRequest, TokenResponse, UserResponse
 from app.repository.user_repository import UserRepository
 from app.repository.token_repository import TokenRepository
@@ -88,9 +90,9 @@ class AuthUsecase:
         Raises:
             UnauthorizedException: If credentials are invalid
         """
-        # Get user by username (DB operation in transaction)
-        async with self.session.begin():
-            user = await self.user_repo.get_by_username(request.username)
+        # Get id and password hash by username (single read, autocommit)
+        async with autocommit_read(self.session):
+            user = await self.user_repo.get_auth_row_by_username(request.username)
 
         # Verify credentials (no DB operations)
         if not user:
@@ -125,8 +127,8 @@ class AuthUsecase:
         except jwt.InvalidTokenError:
             raise InvalidTokenException()
 
-        # Get user from database (DB operation in transaction)
-        async with self.session.begin():
+        # Get user from database (single read, autocommit)
+        async with autocommit_read(self.session):
             user = await self.user_repo.get_by_id(user_id)
 
         if not user:
@@ -158,33 +160,38 @@ class AuthUsecase:
             TokenRevokedException: If token has been revoked
             InvalidTokenException: If token is invalid or user not found
         """
+        # Malformed tokens can't match any stored hash; reject without a lookup
+        if not validate_token_format(pat_token):
+            raise InvalidTokenException()
+
         # Hash the token (domain service)
         token_hash = hash_token(pat_token)
 
-        # All DB operations in a single transaction
-        async with self.session.begin():
-            # Validate token (repository)
-            is_valid, token = await self.token_repo.is_valid(token_hash)
+        # Recently used tokens skip the lookup query
+        token_with_user = token_cache.get(token_hash)
 
-            if not is_valid or not token:
-                # Raise specific exception based on failure reason
-                # Audit logging is handled by AuditLogMiddleware after response
-                if token:
-                    if token.is_revoked:
-                        raise TokenRevokedException()
-                    elif datetime.now(timezone.utc) > token.expires_at:
-                        raise TokenExpiredException()
+        if token_with_user is None:
+            # Single read (last_used_at is buffered, not written here), autocommit
+            async with autocommit_read(self.session):
+                # Get token and its owner in one query (repository)
+                token_with_user = await self.token_repo.get_token_with_user(token_hash)
 
+            if not token_with_user:
+                # Token not found, or its user was deleted
                 raise InvalidTokenException()
 
-            # Get user
-            user = await self.user_repo.get_by_id(token.user_id)
-            if not user:
-                # User not found means token is invalid (user was deleted)
-                raise InvalidTokenException()
+            token_cache.set(token_hash, *token_with_user)
+
+        token, user = token_with_user
+
+        # Raise specific exception based on failure reason
+        # Audit logging is handled by AuditLogMiddleware after response
+        if token.is_revoked:
+            raise TokenRevokedException()
+        if datetime.now(timezone.utc) > token.expires_at:
+            raise TokenExpiredException()
 
-            # Update last used timestamp
-            await self.token_repo.update_last_used(token.id)
-            # Auto-commit on success
+        # Update last used timestamp (buffered in memory, no DB operation)
+        await self.token_repo.update_last_used(token.id)
 
-            return token, user
+        return token, user
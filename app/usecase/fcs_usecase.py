@@ -1,48 +1,132 @@
 """FCS file usecase for file upload and analysis."""
+import asyncio
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
 from sqlalchemy.ext.asyncio import AsyncSession
 import fcsparser
 import numpy as np
 
+from app.common.config import settings
 from app.common.exceptions import NotFoundException, ForbiddenException, ValidationException
 from app.common.id_utils import generate_uuid7
-from app.domain.permissions import parse_scope, get_implied_permissions
+from app.domain.permissions import find_granted_by
 from app.repository.fcs_repository import FCSRepository
 
 
-class FCSUsecase:
-    """Usecase for FCS file operations."""
+# Process pool for CPU-bound statistics so large files don't block the event
+# loop; created by start_statistics_pool() at application startup
+_statistics_pool: ProcessPoolExecutor | None = None
 
-    def __init__(self, session: AsyncSession, upload_dir: str = "uploads"):
-        self.session = session
-        self.fcs_repo = FCSRepository(session)
-        self.upload_dir = upload_dir
 
-        # Ensure upload directory exists
-        os.makedirs(upload_dir, exist_ok=True)
+def start_statistics_pool(max_workers: int = settings.statistics_workers) -> None:
+    """Create the statistics process pool.
 
-    def _find_granted_by(self, user_scopes: list[str], required_scope: str) -> str | None:
-        """Find which scope granted the required permission."""
-        try:
-            required_resource, required_permission = parse_scope(required_scope)
-        except ValueError:
-            return None
+    Workers are started with forkserver (spawn where it is unavailable):
+    forking the server process itself, which already runs an event loop,
+    database connections and executor threads, is unsafe.
+
+    Args:
+        max_workers: Number of worker processes
+    """
+    global _statistics_pool
+    start_method = (
+        "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    )
+    _statistics_pool = ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context(start_method),
+    )
+
+
+def shutdown_statistics_pool() -> None:
+    """Shut the statistics process pool down, cancelling pending work."""
+    global _statistics_pool
+    if _statistics_pool is not None:
+        _statistics_pool.shutdown(wait=False, cancel_futures=True)
+        _statistics_pool = None
+
+
+def _get_statistics_pool() -> ProcessPoolExecutor:
+    """Get the statistics process pool started at application startup."""
+    if _statistics_pool is None:
+        raise RuntimeError("Statistics process pool is not started")
+    return _statistics_pool
+
+
+def _events_path(file_path: str) -> str:
+    """Get the path of the event array stored next to an FCS file."""
+    return os.path.splitext(file_path)[0] + ".npy"
+
+
+def _load_events(file_path: str) -> np.ndarray:
+    """Load FCS event data as a 2D array (events x parameters).
+
+    Memory-maps the array written at upload time so reads never re-parse
+    the FCS file. Falls back to parsing for files uploaded before the
+    array was stored.
+
+    Args:
+        file_path: Path to stored FCS file
+
+    Returns:
+        Event data array, columns ordered by parameter index
+    """
+    try:
+        return np.load(_events_path(file_path), mmap_mode="r")
+    except FileNotFoundError:
+        _, data = fcsparser.parse(file_path, reformat_meta=True)
+        return data.to_numpy()
+
+
+@lru_cache(maxsize=4)
+def _load_fcs_data(file_path: str, mtime: float) -> np.ndarray:
+    """Load FCS event data, cached per worker process by (path, mtime)."""
+    return _load_events(file_path)
+
+
+def _compute_statistics(
+    file_path: str, parameters: list[tuple[int, str, str, str]]
+) -> tuple[int, list[dict]]:
+    """Calculate per-parameter statistics (runs in the statistics process pool).
 
-        for scope in user_scopes:
-            try:
-                resource, permission = parse_scope(scope)
-            except ValueError:
-                continue
+    Args:
+        file_path: Path to stored FCS file
+        parameters: List of (index, pnn, pns, display) tuples
 
-            if resource != required_resource:
-                continue
+    Returns:
+        Tuple of (total events, list of statistics dicts)
+    """
+    data = _load_fcs_data(file_path, os.path.getmtime(file_path))
 
-            implied_permissions = get_implied_permissions(resource, permission)
-            if required_permission in implied_permissions:
-                return scope
+    statistics = []
+    for index, pnn, pns, display in parameters:
+        column_data = data[:, index - 1]
 
-        return None
+        statistics.append({
+            "parameter": pnn,
+            "pns": pns,
+            "display": display,
+            "min": float(np.min(column_data)),
+            "max": float(np.max(column_data)),
+            "mean": float(np.mean(column_data)),
+            "median": float(np.median(column_data)),
+            "std": float(np.std(column_data)),
+        })
+
+    return len(data), statistics
+
+
+class FCSUsecase:
+    """Usecase for FCS file operations."""
+
+    def __init__(self, session: AsyncSession, upload_dir: str = settings.upload_dir):
+        # Upload directory is created once at application startup (see lifespan)
+        self.session = session
+        self.fcs_repo = FCSRepository(session)
+        self.upload_dir = upload_dir
 
     async def upload_file(
         self, filename: str, file_content: bytes, scopes: list[str]
@@ -61,7 +145,7 @@ class FCSUsecase:
             ValidationException: If file is invalid
         """
         required_scope = "fcs:write"
-        granted_by = self._find_granted_by(scopes, required_scope)
+        granted_by = find_granted_by(scopes, required_scope)
 
         # Validate filename
         if not filename.lower().endswith('.fcs'):
@@ -70,6 +154,7 @@ class FCSUsecase:
         # Generate UUID for file path
         file_uuid = str(generate_uuid7())
         file_path = os.path.join(self.upload_dir, f"{file_uuid}.fcs")
+        events_path = _events_path(file_path)
 
         # Save file to disk
         with open(file_path, 'wb') as f:
@@ -83,6 +168,9 @@ class FCSUsecase:
             total_events = len(data)
             total_parameters = len(data.columns)
 
+            # Store parsed events so reads never re-parse the FCS file
+            np.save(events_path, data.to_numpy())
+
             # Create FCS file record and parameters in one transaction
             async with self.session.begin():
                 fcs_file = await self.fcs_repo.create_file(
@@ -116,9 +204,12 @@ class FCSUsecase:
             }
 
         except Exception as e:
-            # Clean up file if parsing fails
-            if os.path.exists(file_path):
-                os.remove(file_path)
+            # Clean up files if parsing fails
+            for path in (file_path, events_path):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
             raise ValidationException(f"Failed to parse FCS file: {str(e)}")
 
     async def get_parameters(self, scopes: list[str]) -> dict:
@@ -134,7 +225,7 @@ class FCSUsecase:
             NotFoundException: If no file found
         """
         required_scope = "fcs:read"
-        granted_by = self._find_granted_by(scopes, required_scope)
+        granted_by = find_granted_by(scopes, required_scope)
 
         # Get latest FCS file from database
         async with self.session.begin():
@@ -162,7 +253,7 @@ class FCSUsecase:
         }
 
     async def get_events(
-        self, scopes: list[str], limit: int = 100, offset: int = 0
+        self, scopes: list[str], limit: int = 100, offset: int = 0, orient: str = "records"
     ) -> dict:
         """Get FCS file events (data) from latest file (globally shared).
 
@@ -170,6 +261,8 @@ class FCSUsecase:
             scopes: User's granted scopes
             limit: Max number of events to return
             offset: Number of events to skip
+            orient: "records" returns one dict per event; "columns" returns
+                parameter names once plus one value list per event
 
         Returns:
             Event data
@@ -178,23 +271,33 @@ class FCSUsecase:
             NotFoundException: If no file found
         """
         required_scope = "fcs:read"
-        granted_by = self._find_granted_by(scopes, required_scope)
+        granted_by = find_granted_by(scopes, required_scope)
 
         # Get latest FCS file from database
         async with self.session.begin():
-            fcs_file = await self.fcs_repo.get_latest_file()
+            fcs_file = await self.fcs_repo.get_latest_file_with_parameters()
 
         if not fcs_file:
             raise NotFoundException("No FCS file found")
 
-        # Parse FCS file to get events (outside transaction)
-        _, data = fcsparser.parse(fcs_file.file_path, reformat_meta=True)
+        # Load stored event data (outside transaction)
+        data = _load_events(fcs_file.file_path)
+        columns = [param.pnn for param in sorted(fcs_file.parameters, key=lambda p: p.index)]
 
-        # Get subset of events
-        events_subset = data.iloc[offset : offset + limit]
+        # Get subset of events as native Python values (one C call, no per-value boxing)
+        rows = data[offset : offset + limit].tolist()
+
+        if orient == "columns":
+            return {
+                "total_events": len(data),
+                "limit": limit,
+                "offset": offset,
+                "columns": columns,
+                "events": rows,
+            }
 
         # Convert to list of dicts
-        events = events_subset.to_dict(orient='records')
+        events = [dict(zip(columns, row)) for row in rows]
 
         return {
             "total_events": len(data),
@@ -216,7 +319,7 @@ class FCSUsecase:
             NotFoundException: If no file found
         """
         required_scope = "fcs:analyze"
-        granted_by = self._find_granted_by(scopes, required_scope)
+        granted_by = find_granted_by(scopes, required_scope)
 
         # Get latest FCS file from database
         async with self.session.begin():
@@ -225,26 +328,16 @@ class FCSUsecase:
         if not fcs_file:
             raise NotFoundException("No FCS file found")
 
-        # Parse FCS file and calculate statistics (outside transaction)
-        _, data = fcsparser.parse(fcs_file.file_path, reformat_meta=True)
-
-        # Calculate statistics for each parameter
-        statistics = []
-        for param in fcs_file.parameters:
-            column_data = data[data.columns[param.index - 1]]
-
-            statistics.append({
-                "parameter": param.pnn,
-                "pns": param.pns,
-                "display": param.display,
-                "min": float(np.min(column_data)),
-                "max": float(np.max(column_data)),
-                "mean": float(np.mean(column_data)),
-                "median": float(np.median(column_data)),
-                "std": float(np.std(column_data)),
-            })
+        # Load event data and calculate statistics in the process pool (outside transaction)
+        parameters = [
+            (param.index, param.pnn, param.pns, param.display)
+            for param in fcs_file.parameters
+        ]
+        total_events, statistics = await asyncio.get_running_loop().run_in_executor(
+            _get_statistics_pool(), _compute_statistics, fcs_file.file_path, parameters
+        )
 
         return {
-            "total_events": len(data),
+            "total_events": total_events,
             "statistics": statistics,
         }
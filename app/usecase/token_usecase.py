@@ -1,11 +1,16 @@
 """Token usecase for PAT management."""
 import logging
+from datetime import datetime
 from uuid import UUID
 
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
+from app.common.audit_queue import audit_log_queue
+from app.common.database import autocommit_read
+from app.common.token_cache import token_cache
 from app.common.exceptions import (
     NotFoundException,
     ForbiddenException,
@@ -13,10 +18,10 @@ from app.common.exceptions import (
     ServiceUnavailableException,
     InternalServerException,
 )
+from app.domain.pagination import encode_cursor, decode_cursor
 from app.domain.permissions import validate_scopes
 from app.domain.token_service import create_token_info, calculate_expiry_date
 from app.repository.exceptions import (
-    DuplicateRecordException,
     DatabaseConnectionException,
     DatabaseOperationException,
 )
@@ -30,6 +35,10 @@ from app.domain.schemas import (
 from app.repository.token_repository import TokenRepository
 from app.repository.audit_log_repository import AuditLogRepository
 
+# Validates a whole token list in one pydantic-core call instead of one
+# model_validate per row
+_TOKEN_LIST_ADAPTER = TypeAdapter(list[TokenListItem])
+
 
 class TokenUsecase:
     """Usecase for PAT token operations."""
@@ -64,18 +73,16 @@ class TokenUsecase:
         # Calculate expiry (no DB operation)
         expires_at = calculate_expiry_date(request.expires_in_days)
 
-        # Retry token generation if hash collision occurs (extremely rare)
-        max_retries = 3
-        token = None
-        token_info = None
-
-        for attempt in range(max_retries):
-            # Generate token (no DB operation)
-            token_info = create_token_info()
+        # Token hash collisions are astronomically unlikely, so one retry
+        # is plenty; a collision just returns no row (no exception path)
+        max_attempts = 2
 
-            try:
-                # Create token in database (DB operation in transaction)
-                async with self.session.begin():
+        try:
+            # Create token in database (DB operation in transaction)
+            async with self.session.begin():
+                for _ in range(max_attempts):
+                    # Generate token (no DB operation)
+                    token_info = create_token_info()
                     token = await self.token_repo.create(
                         user_id=user_id,
                         name=request.name,
@@ -84,24 +91,17 @@ class TokenUsecase:
                         scopes=request.scopes,
                         expires_at=expires_at,
                     )
-                    # Auto-commit on success
-                break  # Success, exit retry loop
-            except DuplicateRecordException:
-                # Hash collision detected (extremely rare), auto-rollback
-                if attempt == max_retries - 1:
-                    raise ValidationException(
-                        "Failed to generate unique token after multiple attempts"
-                    )
-                # Retry with new token
-                continue
-            except DatabaseConnectionException:
-                # Auto-rollback
-                raise ServiceUnavailableException()
-            except DatabaseOperationException:
-                # Auto-rollback
-                raise InternalServerException("Failed to create token")
-
-        if not token or not token_info:
+                    if token is not None:
+                        break
+                else:
+                    # Auto-rollback
+                    raise InternalServerException("Failed to generate unique token")
+                # Auto-commit on success
+        except DatabaseConnectionException:
+            # Auto-rollback
+            raise ServiceUnavailableException()
+        except DatabaseOperationException:
+            # Auto-rollback
             raise InternalServerException("Failed to create token")
 
         return TokenCreateResponse(
@@ -114,25 +114,43 @@ class TokenUsecase:
             created_at=token.created_at,
         )
 
-    async def list_tokens(self, user_id: UUID) -> TokenListResponse:
-        """List all tokens for a user.
+    async def list_tokens(
+        self, user_id: UUID, limit: int | None = None, cursor: str | None = None
+    ) -> TokenListResponse:
+        """List tokens for a user, newest first.
 
         Args:
             user_id: User UUID
+            limit: Maximum number of tokens per page (all tokens if None)
+            cursor: next_cursor from the previous page
 
         Returns:
             TokenListResponse with list of tokens (without full token)
+
+        Raises:
+            ValidationException: If cursor is malformed
         """
-        # Get tokens from database (DB operation in transaction)
-        async with self.session.begin():
-            tokens = await self.token_repo.list_by_user(user_id)
+        after = self._decode_cursor(cursor)
+
+        # Get tokens from database (single SELECT, no explicit transaction)
+        # Fetch one extra row to learn whether another page exists
+        async with autocommit_read(self.session):
+            tokens = await self.token_repo.list_by_user(
+                user_id, after=after, limit=None if limit is None else limit + 1
+            )
+
+        next_cursor = None
+        if limit is not None and len(tokens) > limit:
+            tokens = tokens[:limit]
+            next_cursor = encode_cursor(tokens[-1].created_at, tokens[-1].id)
 
         # Transform to response (no DB operation)
-        token_items = [TokenListItem.model_validate(token) for token in tokens]
+        token_items = _TOKEN_LIST_ADAPTER.validate_python(tokens, from_attributes=True)
 
         return TokenListResponse(
             tokens=token_items,
             total=len(token_items),
+            next_cursor=next_cursor,
         )
 
     async def get_token(self, user_id: UUID, token_id: UUID) -> TokenDetailResponse:
@@ -149,8 +167,8 @@ class TokenUsecase:
             NotFoundException: If token not found
             ForbiddenException: If token doesn't belong to user
         """
-        # Get token from database (DB operation in transaction)
-        async with self.session.begin():
+        # Get token from database (single SELECT, no explicit transaction)
+        async with autocommit_read(self.session):
             token = await self.token_repo.get_by_id(token_id)
 
         # Validate ownership (no DB operation)
@@ -176,23 +194,29 @@ class TokenUsecase:
             NotFoundException: If token not found
             ForbiddenException: If token doesn't belong to user
         """
-        # Get token and revoke in same transaction (both are DB operations)
         async with self.session.begin():
-            token = await self.token_repo.get_by_id(token_id)
+            # Ownership is enforced by the UPDATE's WHERE clause
+            revoked_token = await self.token_repo.revoke_owned(token_id, user_id)
 
-            if not token:
-                raise NotFoundException("Token not found")
-
-            if token.user_id != user_id:
+            if not revoked_token:
+                # Only failed revokes pay for the probe telling 404 from 403
+                if not await self.token_repo.exists(token_id):
+                    raise NotFoundException("Token not found")
                 raise ForbiddenException("Access denied to this token")
-
-            revoked_token = await self.token_repo.revoke(token_id)
             # Auto-commit on success
 
+        # Stop accepting the token in this process right away
+        token_cache.invalidate(revoked_token.token_hash)
+
         return TokenDetailResponse.model_validate(revoked_token)
 
     async def get_token_logs(
-        self, user_id: UUID, token_id: UUID, limit: int = 100, offset: int = 0
+        self,
+        user_id: UUID,
+        token_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: str | None = None,
     ):
         """Get audit logs for a token.
 
@@ -200,7 +224,8 @@ class TokenUsecase:
             user_id: User UUID
             token_id: Token UUID
             limit: Maximum number of logs to return
-            offset: Number of logs to skip
+            offset: Number of logs to skip (ignored when cursor is given)
+            cursor: next_cursor from the previous page
 
         Returns:
             Dict with token info and logs
@@ -208,7 +233,13 @@ class TokenUsecase:
         Raises:
             NotFoundException: If token not found
             ForbiddenException: If token doesn't belong to user
+            ValidationException: If cursor is malformed
         """
+        after = self._decode_cursor(cursor)
+
+        # Make entries from requests that already completed visible
+        await audit_log_queue.flush()
+
         # Get token and logs in transaction (all DB operations)
         async with self.session.begin():
             token = await self.token_repo.get_by_id(token_id)
@@ -219,31 +250,49 @@ class TokenUsecase:
             if token.user_id != user_id:
                 raise ForbiddenException("Access denied to this token")
 
-            logs, total = await self.audit_repo.list_by_token(token_id, limit=limit, offset=offset)
+            # Rows come back already keyed by response field name
+            logs, total, total_exact = await self.audit_repo.list_by_token_projected(
+                token_id, limit=limit + 1, offset=offset, after=after
+            )
+
+        next_cursor = None
+        if len(logs) > limit:
+            logs = logs[:limit]
+            next_cursor = encode_cursor(logs[-1]["timestamp"], logs[-1]["id"])
+
+        # Drop the cursor-only id, and reason on authorized entries (no DB operation)
+        for log in logs:
+            del log["id"]
+            if log["authorized"]:
+                del log["reason"]
 
-        # Format response (no DB operation)
         return {
             "token_id": token.id,
             "token_name": token.name,
             "total_logs": total,
-            "logs": [
-                {
-                    "timestamp": log.timestamp,
-                    "ip": log.ip_address,
-                    "method": log.method,
-                    "endpoint": log.endpoint,
-                    "status_code": log.status_code,
-                    "authorized": log.authorized,
-                    **({} if log.authorized else {"reason": log.reason}),
-                }
-                for log in logs
-            ],
+            "total_logs_exact": total_exact,
+            "next_cursor": next_cursor,
+            "logs": logs,
         }
 
+    @staticmethod
+    def _decode_cursor(cursor: str | None) -> tuple[datetime, UUID] | None:
+        """Decode an optional pagination cursor.
+
+        Raises:
+            ValidationException: If cursor is malformed
+        """
+        if cursor is None:
+            return None
+        try:
+            return decode_cursor(cursor)
+        except ValueError:
+            raise ValidationException("Invalid pagination cursor")
+
     async def log_token_usage(
         self,
         token_id: UUID,
-        ip_address: str,
+        ip_address: str | None,
         method: str,
         endpoint: str,
         status_code: int,
@@ -252,12 +301,12 @@ class TokenUsecase:
     ):
         """Log token usage to audit log.
 
-        Uses the same session but in an independent transaction block.
-        This ensures audit log is persisted regardless of the main transaction outcome.
+        The entry is queued and written in a batch by the background audit
+        log consumer, so no transaction is opened on the request path.
 
         Args:
             token_id: Token UUID
-            ip_address: Client IP address
+            ip_address: Client IP address (None if unknown)
             method: HTTP method
             endpoint: API endpoint
             status_code: Final HTTP response status code
@@ -265,19 +314,15 @@ class TokenUsecase:
             reason: Optional reason for failure
         """
         try:
-            # Create audit log in a transaction
-            # Use begin() - works whether session is in transaction or not
-            async with self.session.begin():
-                await self.audit_repo.create(
-                    token_id=token_id,
-                    ip_address=ip_address,
-                    method=method,
-                    endpoint=endpoint,
-                    status_code=status_code,
-                    authorized=authorized,
-                    reason=reason,
-                )
-                # Auto-commit on context exit
+            await audit_log_queue.put(
+                token_id=token_id,
+                ip_address=ip_address,
+                method=method,
+                endpoint=endpoint,
+                status_code=status_code,
+                authorized=authorized,
+                reason=reason,
+            )
         except Exception as e:
             # Don't let audit logging errors affect anything
             logger.error(f"Failed to log token usage: {e}", exc_info=True)
@@ -1,5 +1,29 @@
 """User usecase (stub implementation)."""
-from app.domain.permissions import parse_scope, get_implied_permissions
+from app.domain.permissions import find_granted_by
+
+
+# Static parts of the stub responses, built once at import time. Handlers
+# overlay the per-request fields; the shared values must never be mutated.
+_GET_CURRENT_USER_TEMPLATE = {
+    "endpoint": "/api/v1/users/me",
+    "method": "GET",
+    "required_scope": "users:read",
+    "message": "This is a stub implementation",
+}
+
+_STUB_USER_FIELDS = {
+    "username": "current_user",
+    "email": "user@example.com",
+    "created_at": "2025-01-01T00:00:00Z",
+}
+
+_UPDATE_USER_TEMPLATE = {
+    "endpoint": "/api/v1/users/me",
+    "method": "PUT",
+    "required_scope": "users:write",
+    "message": "This is a stub implementation",
+    "updated": True,
+}
 
 
 class UserUsecase:
@@ -9,41 +33,6 @@ class UserUsecase:
     In a real application, this would interact with actual user repositories.
     """
 
-    def _find_granted_by(self, user_scopes: list[str], required_scope: str) -> str | None:
-        """Find which scope granted the required permission.
-
-        Args:
-            user_scopes: User's granted scopes
-            required_scope: Required scope
-
-        Returns:
-            The scope that granted the permission, or None
-        """
-        try:
-            required_resource, required_permission = parse_scope(required_scope)
-        except ValueError:
-            return None
-
-        # Check each user scope
-        for scope in user_scopes:
-            try:
-                resource, permission = parse_scope(scope)
-            except ValueError:
-                continue
-
-            # Only check scopes for the same resource
-            if resource != required_resource:
-                continue
-
-            # Get all permissions implied by this scope
-            implied_permissions = get_implied_permissions(resource, permission)
-
-            # Check if required permission is in the implied permissions
-            if required_permission in implied_permissions:
-                return scope
-
-        return None
-
     async def get_current_user(self, user_id: str, scopes: list[str]) -> dict:
         """Get current user info (stub).
 
@@ -54,22 +43,12 @@ class UserUsecase:
         Returns:
             Mock current user info
         """
-        required_scope = "users:read"
-        granted_by = self._find_granted_by(scopes, required_scope)
-
+        template = _GET_CURRENT_USER_TEMPLATE
         return {
-            "endpoint": "/api/v1/users/me",
-            "method": "GET",
-            "required_scope": required_scope,
-            "granted_by": granted_by,
+            **template,
+            "granted_by": find_granted_by(scopes, template["required_scope"]),
             "your_scopes": scopes,
-            "message": "This is a stub implementation",
-            "user": {
-                "id": user_id,
-                "username": "current_user",
-                "email": "user@example.com",
-                "created_at": "2025-01-01T00:00:00Z",
-            },
+            "user": {"id": user_id, **_STUB_USER_FIELDS},
         }
 
     async def update_user(self, user_id: str, scopes: list[str]) -> dict:
@@ -82,15 +61,9 @@ class UserUsecase:
         Returns:
             Mock update result
         """
-        required_scope = "users:write"
-        granted_by = self._find_granted_by(scopes, required_scope)
-
+        template = _UPDATE_USER_TEMPLATE
         return {
-            "endpoint": "/api/v1/users/me",
-            "method": "PUT",
-            "required_scope": required_scope,
-            "granted_by": granted_by,
+            **template,
+            "granted_by": find_granted_by(scopes, template["required_scope"]),
             "your_scopes": scopes,
-            "message": "This is a stub implementation",
-            "updated": True,
         }
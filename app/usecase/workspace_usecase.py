@@ -1,5 +1,49 @@
 """Workspace usecase (stub implementation)."""
-from app.domain.permissions import has_permission, parse_scope, get_implied_permissions
+from app.domain.permissions import has_permission, find_granted_by
+
+
+# Static parts of the stub responses, built once at import time. Handlers
+# overlay the per-request fields; the shared values must never be mutated.
+_LIST_WORKSPACES_TEMPLATE = {
+    "endpoint": "/api/v1/workspacess",
+    "method": "GET",
+    "required_scope": "workspacess:read",
+    "message": "This is a stub implementation",
+    "workspaces": (
+        {"id": "ws_001", "name": "Default Workspace"},
+        {"id": "ws_002", "name": "Project Alpha"},
+    ),
+}
+
+_CREATE_WORKSPACE_TEMPLATE = {
+    "endpoint": "/api/v1/workspacess",
+    "method": "POST",
+    "required_scope": "workspacess:write",
+    "message": "This is a stub implementation",
+    "workspace": {
+        "id": "ws_new_001",
+        "name": "New Workspace",
+        "created_at": "2025-12-13T00:00:00Z",
+    },
+}
+
+_DELETE_WORKSPACE_TEMPLATE = {
+    "method": "DELETE",
+    "required_scope": "workspacess:delete",
+    "message": "This is a stub implementation",
+    "deleted": True,
+}
+
+_UPDATE_SETTINGS_TEMPLATE = {
+    "method": "PUT",
+    "required_scope": "workspacess:admin",
+    "message": "This is a stub implementation",
+    "settings": {
+        "theme": "dark",
+        "notifications": True,
+        "auto_save": True,
+    },
+}
 
 
 class WorkspaceUsecase:
@@ -9,41 +53,6 @@ class WorkspaceUsecase:
     In a real application, this would interact with actual workspace repositories.
     """
 
-    def _find_granted_by(self, user_scopes: list[str], required_scope: str) -> str | None:
-        """Find which scope granted the required permission.
-
-        Args:
-            user_scopes: User's granted scopes
-            required_scope: Required scope
-
-        Returns:
-            The scope that granted the permission, or None
-        """
-        try:
-            required_resource, required_permission = parse_scope(required_scope)
-        except ValueError:
-            return None
-
-        # Check each user scope
-        for scope in user_scopes:
-            try:
-                resource, permission = parse_scope(scope)
-            except ValueError:
-                continue
-
-            # Only check scopes for the same resource
-            if resource != required_resource:
-                continue
-
-            # Get all permissions implied by this scope
-            implied_permissions = get_implied_permissions(resource, permission)
-
-            # Check if required permission is in the implied permissions
-            if required_permission in implied_permissions:
-                return scope
-
-        return None
-
     async def list_workspaces(self, scopes: list[str]) -> dict:
         """List workspaces (stub).
 
@@ -53,20 +62,11 @@ class WorkspaceUsecase:
         Returns:
             Mock workspace list
         """
-        required_scope = "workspacess:read"
-        granted_by = self._find_granted_by(scopes, required_scope)
-
+        template = _LIST_WORKSPACES_TEMPLATE
         return {
-            "endpoint": "/api/v1/workspacess",
-            "method": "GET",
-            "required_scope": required_scope,
-            "granted_by": granted_by,
+            **template,
+            "granted_by": find_granted_by(scopes, template["required_scope"]),
             "your_scopes": scopes,
-            "message": "This is a stub implementation",
-            "workspaces": [
-                {"id": "ws_001", "name": "Default Workspace"},
-                {"id": "ws_002", "name": "Project Alpha"},
-            ],
         }
 
     async def create_workspace(self, scopes: list[str]) -> dict:
@@ -78,21 +78,11 @@ class WorkspaceUsecase:
         Returns:
             Mock create result
         """
-        required_scope = "workspacess:write"
-        granted_by = self._find_granted_by(scopes, required_scope)
-
+        template = _CREATE_WORKSPACE_TEMPLATE
         return {
-            "endpoint": "/api/v1/workspacess",
-            "method": "POST",
-            "required_scope": required_scope,
-            "granted_by": granted_by,
+            **template,
+            "granted_by": find_granted_by(scopes, template["required_scope"]),
             "your_scopes": scopes,
-            "message": "This is a stub implementation",
-            "workspace": {
-                "id": "ws_new_001",
-                "name": "New Workspace",
-                "created_at": "2025-12-13T00:00:00Z",
-            },
         }
 
     async def delete_workspace(self, workspace_id: str, scopes: list[str]) -> dict:
@@ -105,17 +95,12 @@ class WorkspaceUsecase:
         Returns:
             Mock delete result
         """
-        required_scope = "workspacess:delete"
-        granted_by = self._find_granted_by(scopes, required_scope)
-
+        template = _DELETE_WORKSPACE_TEMPLATE
         return {
             "endpoint": f"/api/v1/workspacess/{workspace_id}",
-            "method": "DELETE",
-            "required_scope": required_scope,
-            "granted_by": granted_by,
+            **template,
+            "granted_by": find_granted_by(scopes, template["required_scope"]),
             "your_scopes": scopes,
-            "message": "This is a stub implementation",
-            "deleted": True,
         }
 
     async def update_workspace_settings(self, workspace_id: str, scopes: list[str]) -> dict:
@@ -128,19 +113,10 @@ class WorkspaceUsecase:
         Returns:
             Mock settings update result
         """
-        required_scope = "workspacess:admin"
-        granted_by = self._find_granted_by(scopes, required_scope)
-
+        template = _UPDATE_SETTINGS_TEMPLATE
         return {
             "endpoint": f"/api/v1/workspacess/{workspace_id}/settings",
-            "method": "PUT",
-            "required_scope": required_scope,
-            "granted_by": granted_by,
+            **template,
+            "granted_by": find_granted_by(scopes, template["required_scope"]),
             "your_scopes": scopes,
-            "message": "This is a stub implementation",
-            "settings": {
-                "theme": "dark",
-                "notifications": True,
-                "auto_save": True,
-            },
         }
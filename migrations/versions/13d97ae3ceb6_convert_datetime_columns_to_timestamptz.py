@@ -17,15 +17,25 @@ depends_on = None
 
 
 def upgrade() -> None:
+    # Fail fast instead of queueing behind long-running transactions
+    op.execute("SET LOCAL lock_timeout = '5s'")
+
     # Convert all datetime columns to timestamptz
+    # One ALTER TABLE per table so each table is locked and rewritten once
     # Users table
-    op.execute('ALTER TABLE users ALTER COLUMN created_at TYPE TIMESTAMPTZ USING created_at AT TIME ZONE \'UTC\'')
-    op.execute('ALTER TABLE users ALTER COLUMN updated_at TYPE TIMESTAMPTZ USING updated_at AT TIME ZONE \'UTC\'')
+    op.execute(
+        'ALTER TABLE users '
+        'ALTER COLUMN created_at TYPE TIMESTAMPTZ USING created_at AT TIME ZONE \'UTC\', '
+        'ALTER COLUMN updated_at TYPE TIMESTAMPTZ USING updated_at AT TIME ZONE \'UTC\''
+    )
 
     # Tokens table
-    op.execute('ALTER TABLE tokens ALTER COLUMN expires_at TYPE TIMESTAMPTZ USING expires_at AT TIME ZONE \'UTC\'')
-    op.execute('ALTER TABLE tokens ALTER COLUMN last_used_at TYPE TIMESTAMPTZ USING last_used_at AT TIME ZONE \'UTC\'')
-    op.execute('ALTER TABLE tokens ALTER COLUMN created_at TYPE TIMESTAMPTZ USING created_at AT TIME ZONE \'UTC\'')
+    op.execute(
+        'ALTER TABLE tokens '
+        'ALTER COLUMN expires_at TYPE TIMESTAMPTZ USING expires_at AT TIME ZONE \'UTC\', '
+        'ALTER COLUMN last_used_at TYPE TIMESTAMPTZ USING last_used_at AT TIME ZONE \'UTC\', '
+        'ALTER COLUMN created_at TYPE TIMESTAMPTZ USING created_at AT TIME ZONE \'UTC\''
+    )
 
     # Audit logs table
     op.execute('ALTER TABLE audit_logs ALTER COLUMN timestamp TYPE TIMESTAMPTZ USING timestamp AT TIME ZONE \'UTC\'')
@@ -35,19 +45,27 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
+    # Fail fast instead of queueing behind long-running transactions
+    op.execute("SET LOCAL lock_timeout = '5s'")
+
     # Convert all timestamptz columns back to timestamp (without timezone)
     # Users table
-    op.execute('ALTER TABLE users ALTER COLUMN created_at TYPE TIMESTAMP USING created_at AT TIME ZONE \'UTC\'')
-    op.execute('ALTER TABLE users ALTER COLUMN updated_at TYPE TIMESTAMP USING updated_at AT TIME ZONE \'UTC\'')
+    op.execute(
+        'ALTER TABLE users '
+        'ALTER COLUMN created_at TYPE TIMESTAMP USING created_at AT TIME ZONE \'UTC\', '
+        'ALTER COLUMN updated_at TYPE TIMESTAMP USING updated_at AT TIME ZONE \'UTC\''
+    )
 
     # Tokens table
-    op.execute('ALTER TABLE tokens ALTER COLUMN expires_at TYPE TIMESTAMP USING expires_at AT TIME ZONE \'UTC\'')
-    op.execute('ALTER TABLE tokens ALTER COLUMN last_used_at TYPE TIMESTAMP USING last_used_at AT TIME ZONE \'UTC\'')
-    op.execute('ALTER TABLE tokens ALTER COLUMN created_at TYPE TIMESTAMP USING created_at AT TIME ZONE \'UTC\'')
+    op.execute(
+        'ALTER TABLE tokens '
+        'ALTER COLUMN expires_at TYPE TIMESTAMP USING expires_at AT TIME ZONE \'UTC\', '
+        'ALTER COLUMN last_used_at TYPE TIMESTAMP USING last_used_at AT TIME ZONE \'UTC\', '
+        'ALTER COLUMN created_at TYPE TIMESTAMP USING created_at AT TIME ZONE \'UTC\''
+    )
 
     # Audit logs table
     op.execute('ALTER TABLE audit_logs ALTER COLUMN timestamp TYPE TIMESTAMP USING timestamp AT TIME ZONE \'UTC\'')
 
     # FCS files table
     op.execute('ALTER TABLE fcs_files ALTER COLUMN uploaded_at TYPE TIMESTAMP USING uploaded_at AT TIME ZONE \'UTC\'')
-
@@ -0,0 +1,53 @@
+"""store audit_logs.method as an enum
+
+Revision ID: 5d2f7a91c3e8
+Revises: c41e8b2d9a67
+Create Date: 2026-10-16 11:48:37.106529
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2f7a91c3e8'
+down_revision = 'c41e8b2d9a67'
+branch_labels = None
+depends_on = None
+
+
+http_method = postgresql.ENUM(
+    'GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'HEAD', 'OPTIONS',
+    name='http_method',
+)
+
+
+def upgrade() -> None:
+    # Fail fast instead of queueing behind long-running transactions
+    op.execute("SET LOCAL lock_timeout = '5s'")
+
+    http_method.create(op.get_bind())
+    # Rewrites every partition
+    op.alter_column(
+        'audit_logs',
+        'method',
+        existing_type=sa.String(length=10),
+        type_=http_method,
+        existing_nullable=False,
+        postgresql_using='method::http_method',
+    )
+
+
+def downgrade() -> None:
+    op.execute("SET LOCAL lock_timeout = '5s'")
+
+    op.alter_column(
+        'audit_logs',
+        'method',
+        existing_type=http_method,
+        type_=sa.String(length=10),
+        existing_nullable=False,
+        postgresql_using='method::text',
+    )
+    http_method.drop(op.get_bind())
@@ -0,0 +1,45 @@
+"""add audit log retrieval indexes
+
+Revision ID: 6bd6d194239e
+Revises: fd8070b4d6f8
+Create Date: 2026-10-16 09:12:41.305518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6bd6d194239e'
+down_revision = 'fd8070b4d6f8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction, but it doesn't block
+    # audit log writes while the indexes are built
+    with op.get_context().autocommit_block():
+        # Token log listing: filter by token, newest first, with every listed
+        # column included so pages are served by an index-only scan
+        op.create_index(
+            'idx_audit_logs_token_ts',
+            'audit_logs',
+            ['token_id', sa.text('timestamp DESC'), sa.text('id DESC')],
+            postgresql_include=['ip_address', 'method', 'endpoint', 'status_code', 'authorized', 'reason'],
+            postgresql_concurrently=True,
+        )
+        # Recent failed requests across all tokens
+        op.create_index(
+            'idx_audit_logs_ts_unauthorized',
+            'audit_logs',
+            [sa.text('timestamp DESC')],
+            postgresql_where=sa.text('authorized = false'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_audit_logs_ts_unauthorized', table_name='audit_logs', postgresql_concurrently=True)
+        op.drop_index('idx_audit_logs_token_ts', table_name='audit_logs', postgresql_concurrently=True)
@@ -0,0 +1,44 @@
+"""store tokens.token_hash as bytea
+
+Revision ID: 8e0b4c6f2a19
+Revises: 5d2f7a91c3e8
+Create Date: 2026-10-16 12:15:02.734918
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e0b4c6f2a19'
+down_revision = '5d2f7a91c3e8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Fail fast instead of queueing behind long-running transactions
+    op.execute("SET LOCAL lock_timeout = '5s'")
+
+    # Hex text to the raw 32-byte digest; the unique index is rebuilt
+    op.alter_column(
+        'tokens',
+        'token_hash',
+        existing_type=sa.String(length=64),
+        type_=sa.LargeBinary(length=32),
+        existing_nullable=False,
+        postgresql_using="decode(token_hash, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    op.execute("SET LOCAL lock_timeout = '5s'")
+
+    op.alter_column(
+        'tokens',
+        'token_hash',
+        existing_type=sa.LargeBinary(length=32),
+        type_=sa.String(length=64),
+        existing_nullable=False,
+        postgresql_using="encode(token_hash, 'hex')",
+    )
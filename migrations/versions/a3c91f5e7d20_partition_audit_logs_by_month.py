@@ -0,0 +1,132 @@
+"""partition audit_logs by month
+
+Revision ID: a3c91f5e7d20
+Revises: 6bd6d194239e
+Create Date: 2026-10-16 10:03:27.448109
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c91f5e7d20'
+down_revision = '6bd6d194239e'
+branch_labels = None
+depends_on = None
+
+
+# Columns shared by the plain and the partitioned table
+COLUMNS = (
+    'id UUID NOT NULL, '
+    'token_id UUID NOT NULL, '
+    'timestamp TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP, '
+    'ip_address VARCHAR(45) NOT NULL, '
+    'method VARCHAR(10) NOT NULL, '
+    'endpoint VARCHAR(255) NOT NULL, '
+    'status_code INTEGER NOT NULL, '
+    'authorized BOOLEAN NOT NULL, '
+    'reason VARCHAR(255), '
+    'CONSTRAINT audit_logs_token_id_fkey FOREIGN KEY (token_id) '
+    'REFERENCES tokens (id) ON DELETE CASCADE'
+)
+
+COLUMN_NAMES = 'id, token_id, timestamp, ip_address, method, endpoint, status_code, authorized, reason'
+
+
+def _create_indexes() -> None:
+    op.create_index('ix_audit_logs_timestamp', 'audit_logs', ['timestamp'])
+    op.create_index(
+        'idx_audit_logs_token_ts',
+        'audit_logs',
+        ['token_id', sa.text('timestamp DESC'), sa.text('id DESC')],
+        postgresql_include=['ip_address', 'method', 'endpoint', 'status_code', 'authorized', 'reason'],
+    )
+    op.create_index(
+        'idx_audit_logs_ts_unauthorized',
+        'audit_logs',
+        [sa.text('timestamp DESC')],
+        postgresql_where=sa.text('authorized = false'),
+    )
+
+
+def _drop_indexes() -> None:
+    op.drop_index('idx_audit_logs_ts_unauthorized', table_name='audit_logs')
+    op.drop_index('idx_audit_logs_token_ts', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_timestamp', table_name='audit_logs')
+
+
+def upgrade() -> None:
+    # Fail fast instead of queueing behind long-running transactions
+    op.execute("SET LOCAL lock_timeout = '5s'")
+
+    # Move the plain table aside, dropping its indexes first since the
+    # partitioned table reuses their names
+    _drop_indexes()
+    op.execute('ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned')
+    op.execute('ALTER TABLE audit_logs_unpartitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_unpartitioned_pkey')
+    op.execute('ALTER TABLE audit_logs_unpartitioned RENAME CONSTRAINT audit_logs_token_id_fkey TO audit_logs_unpartitioned_token_id_fkey')
+
+    # The partition key has to be part of the primary key
+    op.execute(
+        f'CREATE TABLE audit_logs ({COLUMNS}, PRIMARY KEY (id, timestamp)) '
+        'PARTITION BY RANGE (timestamp)'
+    )
+    op.execute('CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT')
+
+    # One partition per month from the oldest existing row through two months
+    # ahead; the app creates later ones at startup
+    op.execute("""
+        DO $$
+        DECLARE
+            month date;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc('month', LEAST(
+                        (SELECT min(timestamp) FROM audit_logs_unpartitioned),
+                        now()
+                    ) AT TIME ZONE 'UTC'),
+                    date_trunc('month', now() AT TIME ZONE 'UTC') + interval '2 months',
+                    interval '1 month'
+                )::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE audit_logs_y%sm%s PARTITION OF audit_logs '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    to_char(month, 'YYYY'), to_char(month, 'MM'),
+                    month::timestamp AT TIME ZONE 'UTC',
+                    (month + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+                );
+            END LOOP;
+        END
+        $$
+    """)
+
+    op.execute(
+        f'INSERT INTO audit_logs ({COLUMN_NAMES}) '
+        f'SELECT {COLUMN_NAMES} FROM audit_logs_unpartitioned'
+    )
+    op.execute('DROP TABLE audit_logs_unpartitioned')
+
+    # Indexes on the parent are created on every partition
+    _create_indexes()
+
+
+def downgrade() -> None:
+    op.execute("SET LOCAL lock_timeout = '5s'")
+
+    _drop_indexes()
+    op.execute('ALTER TABLE audit_logs RENAME TO audit_logs_partitioned')
+    op.execute('ALTER TABLE audit_logs_partitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_partitioned_pkey')
+    op.execute('ALTER TABLE audit_logs_partitioned RENAME CONSTRAINT audit_logs_token_id_fkey TO audit_logs_partitioned_token_id_fkey')
+
+    op.execute(f'CREATE TABLE audit_logs ({COLUMNS}, PRIMARY KEY (id))')
+    op.execute(
+        f'INSERT INTO audit_logs ({COLUMN_NAMES}) '
+        f'SELECT {COLUMN_NAMES} FROM audit_logs_partitioned'
+    )
+    # Drops every partition with it
+    op.execute('DROP TABLE audit_logs_partitioned')
+
+    _create_indexes()
@@ -0,0 +1,74 @@
+"""store audit_logs.ip_address as inet
+
+Revision ID: c41e8b2d9a67
+Revises: a3c91f5e7d20
+Create Date: 2026-10-16 11:20:14.582301
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41e8b2d9a67'
+down_revision = 'a3c91f5e7d20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Fail fast instead of queueing behind long-running transactions
+    op.execute("SET LOCAL lock_timeout = '5s'")
+
+    # The column used to store the client host verbatim: 'unknown' when
+    # there was none, but also non-IP hosts such as a unix socket path or
+    # Starlette's 'testclient'. A plain ::inet cast would abort on any of
+    # them, so values that don't parse as an address become NULL
+    op.execute(
+        """
+        CREATE FUNCTION audit_logs_safe_inet(value text) RETURNS inet
+        LANGUAGE plpgsql IMMUTABLE AS $$
+        BEGIN
+            RETURN value::inet;
+        EXCEPTION WHEN invalid_text_representation THEN
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+
+    # Rewrites every partition
+    op.alter_column(
+        'audit_logs',
+        'ip_address',
+        existing_type=sa.String(length=45),
+        type_=postgresql.INET(),
+        nullable=True,
+        postgresql_using="audit_logs_safe_inet(ip_address)",
+    )
+    op.execute("DROP FUNCTION audit_logs_safe_inet(text)")
+
+    # Client address and subnet lookups. CONCURRENTLY isn't supported on a
+    # partitioned table; the index is created on every partition
+    op.create_index(
+        'idx_audit_logs_ip',
+        'audit_logs',
+        ['ip_address'],
+        postgresql_using='gist',
+        postgresql_ops={'ip_address': 'inet_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.execute("SET LOCAL lock_timeout = '5s'")
+
+    op.drop_index('idx_audit_logs_ip', table_name='audit_logs')
+    op.alter_column(
+        'audit_logs',
+        'ip_address',
+        existing_type=postgresql.INET(),
+        type_=sa.String(length=45),
+        nullable=False,
+        postgresql_using="COALESCE(host(ip_address), 'unknown')",
+    )
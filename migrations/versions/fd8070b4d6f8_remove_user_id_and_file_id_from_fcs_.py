@@ -17,15 +17,20 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Delete all existing FCS files (schema change makes old data incompatible)
-    op.execute('DELETE FROM fcs_files')
-
-    # Drop foreign key constraint for user_id
-    op.drop_constraint('fcs_files_user_id_fkey', 'fcs_files', type_='foreignkey')
-
-    # Drop columns
-    op.drop_column('fcs_files', 'user_id')
-    op.drop_column('fcs_files', 'file_id')
+    # Delete all existing FCS files (schema change makes old data incompatible).
+    # TRUNCATE is intentional: it frees the tables in one metadata operation
+    # instead of deleting (and WAL-logging) every row, leaving no dead tuples.
+    # fcs_parameters is listed explicitly since the DELETE used to cascade to it.
+    op.execute('TRUNCATE fcs_files, fcs_parameters')
+
+    # Drop foreign key constraint for user_id and both columns in a single
+    # ALTER TABLE so the lock is taken once
+    op.execute(
+        'ALTER TABLE fcs_files '
+        'DROP CONSTRAINT fcs_files_user_id_fkey, '
+        'DROP COLUMN user_id, '
+        'DROP COLUMN file_id'
+    )
 
 
 def downgrade() -> None:
@@ -1,104 +1,173 @@
 """Pytest fixtures for testing."""
 import asyncio
+import logging
+import os
 from datetime import datetime, timedelta, timezone
 from typing import AsyncGenerator
+from uuid import UUID
 
+import orjson
 import pytest
-from httpx import AsyncClient, ASGITransport
+from argon2 import PasswordHasher
+from httpx import AsyncClient, ASGITransport, Response
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.exc import ProgrammingError
-from sqlalchemy import text
+from slowapi import Limiter
+from sqlalchemy import insert, select, text
+from sqlalchemy.orm import configure_mappers
 
 from app.main import app
-from app.common.database import Base, get_db
+from app.common.audit_partitions import ensure_audit_log_partitions
+from app.common.audit_queue import audit_log_queue
+from app.common.database import Base, get_db, warm_up_pool
+from app.common.id_utils import generate_uuid7
 from app.common.config import settings
 from app.common.rate_limit import limiter
-from app.domain.auth_service import hash_password
+from app.common.token_cache import token_cache
+from app.domain import auth_service
+from app.domain.auth_service import create_access_token
 from app.domain.token_service import create_token_info, calculate_expiry_date
+from app.models.fcs import FCSFile, FCSParameter
+from app.usecase.fcs_usecase import FCSUsecase, start_statistics_pool, shutdown_statistics_pool
+from tests.fcs_helpers import create_mock_fcs_file
 from app.models.user import User
 from app.models.token import Token
 
+logger = logging.getLogger(__name__)
 
-# Test database URL
-TEST_DATABASE_URL = settings.database_url.replace("/pat_db", "/pat_test")
 
+# Tests run in their own schema of the application database, one per xdist
+# worker, so setup and teardown need no cluster-wide CREATE/DROP DATABASE
+TEST_DATABASE_URL = settings.database_url
+TEST_SCHEMA = f"pat_test_{os.environ.get('PYTEST_XDIST_WORKER', 'main')}"
 
-async def ensure_test_database_exists():
-    """Ensure test database exists, create if it doesn't."""
-    # Connect to postgres database to create pat_test database
-    postgres_url = settings.database_url.replace("/pat_db", "/postgres")
-    engine = create_async_engine(postgres_url, isolation_level="AUTOCOMMIT", echo=False)
+# Argon2 with minimal cost parameters. Real Argon2 hashes, so verification
+# and hash format checks behave as in production, at a fraction of the cost
+FAST_PASSWORD_HASHER = PasswordHasher(time_cost=1, memory_cost=8, parallelism=1)
 
-    async with engine.connect() as conn:
-        # Check if database exists
-        result = await conn.execute(
-            text("SELECT 1 FROM pg_database WHERE datname = 'pat_test'")
-        )
-        exists = result.scalar() is not None
+# Fixture users all share one password; hash it once instead of per test
+TEST_PASSWORD = "password123"
+TEST_PASSWORD_HASH = FAST_PASSWORD_HASHER.hash(TEST_PASSWORD)
 
-        if not exists:
-            # Create test database
-            await conn.execute(text("CREATE DATABASE pat_test"))
-            print("✓ Created test database: pat_test")
+# Fixture users keep the same ids for the whole session (tables are truncated
+# between tests), so JWTs minted for them stay valid and can be reused
+USER_A_ID = generate_uuid7()
+USER_B_ID = generate_uuid7()
 
-    await engine.dispose()
+# Empties every application table between tests
+TRUNCATE_SQL = text(
+    "TRUNCATE "
+    + ", ".join(table.name for table in Base.metadata.sorted_tables)
+    + " RESTART IDENTITY CASCADE"
+)
 
 
-async def cleanup_test_database():
-    """Drop test database after all tests complete."""
-    # Connect to postgres database to drop pat_test database
-    postgres_url = settings.database_url.replace("/pat_db", "/postgres")
-    engine = create_async_engine(postgres_url, isolation_level="AUTOCOMMIT", echo=False)
+async def ensure_test_schema_exists():
+    """Create the test schema if it doesn't exist."""
+    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+
+    async with engine.begin() as conn:
+        await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {TEST_SCHEMA}"))
+    logger.info("Created test schema: %s", TEST_SCHEMA)
+
+    await engine.dispose()
 
-    async with engine.connect() as conn:
-        # Terminate all connections to pat_test
-        await conn.execute(
-            text("""
-                SELECT pg_terminate_backend(pg_stat_activity.pid)
-                FROM pg_stat_activity
-                WHERE pg_stat_activity.datname = 'pat_test'
-                  AND pid <> pg_backend_pid()
-            """)
-        )
 
-        # Drop test database
-        await conn.execute(text("DROP DATABASE IF EXISTS pat_test"))
-        print("✓ Cleaned up test database: pat_test")
+async def cleanup_test_schema():
+    """Drop the test schema and everything in it after all tests complete."""
+    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {TEST_SCHEMA} CASCADE"))
+    logger.info("Dropped test schema: %s", TEST_SCHEMA)
 
     await engine.dispose()
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the session event loop on uvloop when it is available.
+
+    uvloop comes with uvicorn[standard] (not on Windows); fall back to the
+    default asyncio loop without it.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
 
 @pytest.fixture(scope="session", autouse=True)
-async def setup_test_database(event_loop):
-    """Setup test database before any tests run, cleanup after all tests complete."""
-    # Setup: Create test database
-    await ensure_test_database_exists()
+def fast_password_hashing():
+    """Use the cheap Argon2 parameters for every hash made during tests."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(auth_service, "ph", FAST_PASSWORD_HASHER)
+        yield
+
 
+@pytest.fixture(scope="session", autouse=True)
+def _warmup(fast_password_hashing):
+    """Pay one-off initialisation costs before the first test runs.
+
+    Argon2 bindings, token generation, JWT signing and the SQLAlchemy mappers
+    all initialise lazily on first use.
+    """
+    auth_service.hash_password("x")
+    create_token_info()
+    create_access_token(USER_A_ID)
+    configure_mappers()
     yield
 
-    # Teardown: Drop test database
-    await cleanup_test_database()
 
+@pytest.fixture(scope="session", autouse=True)
+def _disable_rate_limiter():
+    """Turn rate limiting off for the session; rate_limit_test re-enables it."""
+    limiter.enabled = False
+    yield
 
-@pytest.fixture(scope="function")
-async def test_db():
-    """Create test database and tables."""
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
 
-    # Create all tables
+@pytest.fixture(scope="session", autouse=True)
+async def setup_test_database():
+    """Setup test schema before any tests run, cleanup after all tests complete."""
+    await ensure_test_schema_exists()
+
+    yield
+
+    await cleanup_test_schema()
+
+
+@pytest.fixture(scope="session")
+async def engine(setup_test_database):
+    """Create one test database engine (and connection pool) for the whole session."""
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        echo=False,
+        pool_size=5,
+        max_overflow=0,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        # Resolve unqualified table names to the test schema only
+        connect_args={"server_settings": {"search_path": TEST_SCHEMA}},
+    )
+    await warm_up_pool(engine, size=5)
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture(scope="session")
+async def tables(engine):
+    """Create all tables once for the whole test session."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
+    await ensure_audit_log_partitions(engine)
+
 
-    # Create session factory
+@pytest.fixture(scope="session")
+async def test_db(engine, tables):
+    """Create the test session factory and route the app's get_db to it."""
     async_session_maker = async_sessionmaker(
         engine,
         class_=AsyncSession,
@@ -112,36 +181,75 @@ async def test_db():
     # Override dependency
     app.dependency_overrides[get_db] = override_get_db
 
-    # Disable rate limiting in tests
-    limiter.enabled = False
+    # Write queued audit log entries to the test database; use a short
+    # interval so tests only need a brief sleep before reading them back
+    audit_log_task = asyncio.create_task(
+        audit_log_queue.run(async_session_maker, flush_interval=0.01)
+    )
+
+    # Worker processes for FCS statistics; one is enough for the tests
+    start_statistics_pool(max_workers=1)
 
     yield async_session_maker
 
     # Cleanup
+    shutdown_statistics_pool()
+    await audit_log_queue.close()
+    await audit_log_task
+
     app.dependency_overrides.clear()
 
-    # Ensure limiter is disabled
-    limiter.enabled = False
 
-    # Clear rate limit storage to prevent test pollution
-    if hasattr(limiter, '_limiter') and hasattr(limiter._limiter, 'storage'):
-        storage = limiter._limiter.storage
-        # Clear all internal data structures
-        if hasattr(storage, 'reset'):
-            storage.reset()
-        if hasattr(storage, 'storage'):
-            storage.storage.clear()
-        if hasattr(storage, 'expirations'):
-            storage.expirations.clear()
-        if hasattr(storage, 'events'):
-            storage.events.clear()
+def assert_forbidden(
+    response: Response, required_scope: str, your_scopes: list[str] | None = None
+) -> None:
+    """Assert a 403 Forbidden body naming the required scope.
+
+    your_scopes, when given, must match the token's scopes in issue order.
+    """
+    assert response.status_code == 403
+    data = orjson.loads(response.content)
+    assert data["error"] == "Forbidden"
+    assert data["data"]["required_scope"] == required_scope
+    if your_scopes is not None:
+        assert data["data"]["your_scopes"] == your_scopes
 
-    await engine.dispose()
+
+def _reset_rate_limit_storage(target: Limiter = limiter):
+    """Clear rate limit counters to prevent test pollution."""
+    # reset() is part of the limits storage interface; for MemoryStorage it
+    # clears counters, expirations, moving-window events and locks at once
+    target._limiter.storage.reset()
 
 
 @pytest.fixture
-async def client(test_db) -> AsyncGenerator[AsyncClient, None]:
-    """Create test client."""
+async def clean_db(test_db, engine):
+    """Give each test empty tables and an empty rate limiter."""
+    # Entries queued by the previous test must be written before emptying
+    await audit_log_queue.flush()
+
+    # Empty all tables instead of rebuilding the schema for every test; a
+    # single autocommit statement, no transaction to begin or commit
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(TRUNCATE_SQL)
+
+    # Cached tokens refer to rows that are about to be truncated
+    token_cache.clear()
+
+    yield test_db
+
+    _reset_rate_limit_storage()
+
+
+@pytest.fixture(scope="session")
+async def asgi_client(test_db) -> AsyncGenerator[AsyncClient, None]:
+    """Create one test client and ASGI transport for the whole session.
+
+    The app lifespan is not run: test_db provides the pieces tests need
+    (database override, audit log consumer, statistics pool) against the
+    test database.
+    """
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test"
@@ -149,6 +257,12 @@ async def client(test_db) -> AsyncGenerator[AsyncClient, None]:
         yield client
 
 
+@pytest.fixture
+def client(clean_db, asgi_client: AsyncClient) -> AsyncClient:
+    """Shared test client, with empty tables for this test."""
+    return asgi_client
+
+
 @pytest.fixture
 def rate_limit_test():
     """Fixture for rate limiting tests that ensures clean storage."""
@@ -161,89 +275,94 @@ def rate_limit_test():
     limiter.enabled = True
 
     # Clear storage before test
-    if hasattr(limiter, '_limiter') and hasattr(limiter._limiter, 'storage'):
-        storage = limiter._limiter.storage
-        if hasattr(storage, 'reset'):
-            storage.reset()
-        if hasattr(storage, 'storage'):
-            storage.storage.clear()
-        if hasattr(storage, 'expirations'):
-            storage.expirations.clear()
-        if hasattr(storage, 'events'):
-            storage.events.clear()
+    _reset_rate_limit_storage(limiter)
 
     yield limiter
 
     # Restore state and clear storage after test
     limiter.enabled = original_enabled
 
-    if hasattr(limiter, '_limiter') and hasattr(limiter._limiter, 'storage'):
-        storage = limiter._limiter.storage
-        if hasattr(storage, 'reset'):
-            storage.reset()
-        if hasattr(storage, 'storage'):
-            storage.storage.clear()
-        if hasattr(storage, 'expirations'):
-            storage.expirations.clear()
-        if hasattr(storage, 'events'):
-            storage.events.clear()
+    _reset_rate_limit_storage(limiter)
 
 
 @pytest.fixture
-async def session(test_db) -> AsyncGenerator[AsyncSession, None]:
-    """Create test database session."""
-    async with test_db() as session:
+async def session(clean_db, engine) -> AsyncGenerator[AsyncSession, None]:
+    """Create test database session.
+
+    Runs in autocommit mode: fixture inserts must be visible to the app's own
+    sessions right away, and each INSERT ... RETURNING then commits on its own
+    without a separate COMMIT round-trip. The commit() calls in fixtures and
+    tests only end the session's transaction scope.
+    """
+    autocommit_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+    async with clean_db(bind=autocommit_engine) as session:
         yield session
 
 
 @pytest.fixture
 async def user_a(session: AsyncSession) -> User:
     """Create test user A."""
-    user = User(
-        username="user_a",
-        email="user_a@example.com",
-        password_hash=hash_password("password123"),
+    # INSERT ... RETURNING loads server defaults without a refresh SELECT
+    result = await session.execute(
+        insert(User).returning(User),
+        [{
+            "id": USER_A_ID,
+            "username": "user_a",
+            "email": "user_a@example.com",
+            "password_hash": TEST_PASSWORD_HASH,
+        }],
     )
-    session.add(user)
+    user = result.scalar_one()
     await session.commit()
-    await session.refresh(user)
     return user
 
 
 @pytest.fixture
 async def user_b(session: AsyncSession) -> User:
     """Create test user B."""
-    user = User(
-        username="user_b",
-        email="user_b@example.com",
-        password_hash=hash_password("password123"),
+    # INSERT ... RETURNING loads server defaults without a refresh SELECT
+    result = await session.execute(
+        insert(User).returning(User),
+        [{
+            "id": USER_B_ID,
+            "username": "user_b",
+            "email": "user_b@example.com",
+            "password_hash": TEST_PASSWORD_HASH,
+        }],
     )
-    session.add(user)
+    user = result.scalar_one()
     await session.commit()
-    await session.refresh(user)
     return user
 
 
+@pytest.fixture(scope="session")
+def user_a_session_jwt() -> str:
+    """JWT for user A's fixed id, signed once per session."""
+    return create_access_token(USER_A_ID)
+
+
+@pytest.fixture(scope="session")
+def user_b_session_jwt() -> str:
+    """JWT for user B's fixed id, signed once per session."""
+    return create_access_token(USER_B_ID)
+
+
 @pytest.fixture
-async def user_a_jwt(client: AsyncClient, user_a: User) -> str:
-    """Get JWT token for user A."""
-    response = await client.post(
-        "/api/v1/auth/login",
-        json={"username": "user_a", "password": "password123"}
-    )
-    assert response.status_code == 200
-    return response.json()["data"]["access_token"]
+def user_a_jwt(user_a: User, user_a_session_jwt: str) -> str:
+    """Get JWT token for user A.
+
+    Minted in-process with the same helper the login endpoint uses, which
+    skips an HTTP round-trip and a password verification per test. Login
+    itself is covered in test_auth_api.py. Depends on user_a so the user
+    row exists for the test.
+    """
+    return user_a_session_jwt
 
 
 @pytest.fixture
-async def user_b_jwt(client: AsyncClient, user_b: User) -> str:
-    """Get JWT token for user B."""
-    response = await client.post(
-        "/api/v1/auth/login",
-        json={"username": "user_b", "password": "password123"}
-    )
-    assert response.status_code == 200
-    return response.json()["data"]["access_token"]
+def user_b_jwt(user_b: User, user_b_session_jwt: str) -> str:
+    """Get JWT token for user B (minted in-process, see user_a_jwt)."""
+    return user_b_session_jwt
 
 
 @pytest.fixture
@@ -260,23 +379,61 @@ async def create_pat_token(session: AsyncSession):
         token_info = create_token_info()
         expires_at = calculate_expiry_date(expires_in_days)
 
-        token = Token(
-            user_id=user_id,
-            name=name,
-            token_hash=token_info.token_hash,
-            token_prefix=token_info.token_prefix,
-            scopes=scopes,
-            expires_at=expires_at,
-            is_revoked=is_revoked,
+        result = await session.execute(
+            insert(Token).returning(Token),
+            [{
+                "user_id": user_id,
+                "name": name,
+                "token_hash": token_info.token_hash,
+                "token_prefix": token_info.token_prefix,
+                "scopes": scopes,
+                "expires_at": expires_at,
+                "is_revoked": is_revoked,
+            }],
         )
-        session.add(token)
+        token = result.scalar_one()
         await session.commit()
-        await session.refresh(token)
         return token_info.full_token, token
 
     return _create_token
 
 
+@pytest.fixture
+async def bulk_create_pat_tokens(session: AsyncSession):
+    """Factory to create several PAT tokens with one multi-row INSERT."""
+    async def _bulk_create(specs: list[dict]) -> list[tuple[str, Token]]:
+        """Create tokens from specs and return [(full_token, token_model), ...].
+
+        Each spec takes the same keys as create_pat_token's arguments:
+        user_id, scopes, and optionally name, expires_in_days, is_revoked.
+        """
+        token_infos = [create_token_info() for _ in specs]
+        rows = [
+            {
+                "user_id": spec["user_id"],
+                "name": spec.get("name", "Test Token"),
+                "token_hash": token_info.token_hash,
+                "token_prefix": token_info.token_prefix,
+                "scopes": spec["scopes"],
+                "expires_at": calculate_expiry_date(spec.get("expires_in_days", 30)),
+                "is_revoked": spec.get("is_revoked", False),
+            }
+            for spec, token_info in zip(specs, token_infos)
+        ]
+
+        result = await session.execute(
+            insert(Token).returning(Token, sort_by_parameter_order=True), rows
+        )
+        tokens = list(result.scalars().all())
+        await session.commit()
+        return [
+            (token_info.full_token, token)
+            for token_info, token in zip(token_infos, tokens)
+        ]
+
+    return _bulk_create
+
+
 @pytest.fixture
 async def expired_token(session: AsyncSession, user_a: User, create_pat_token):
     """Create an expired PAT token."""
@@ -284,15 +441,63 @@ async def expired_token(session: AsyncSession, user_a: User, create_pat_token):
     token_info = create_token_info()
     expires_at = datetime.now(timezone.utc) - timedelta(days=1)
 
-    token = Token(
-        user_id=user_a.id,
-        name="Expired Token",
-        token_hash=token_info.token_hash,
-        token_prefix=token_info.token_prefix,
-        scopes=["workspacess:read"],
-        expires_at=expires_at,
+    result = await session.execute(
+        insert(Token).returning(Token),
+        [{
+            "user_id": user_a.id,
+            "name": "Expired Token",
+            "token_hash": token_info.token_hash,
+            "token_prefix": token_info.token_prefix,
+            "scopes": ["workspacess:read"],
+            "expires_at": expires_at,
+        }],
     )
-    session.add(token)
+    token = result.scalar_one()
     await session.commit()
-    await session.refresh(token)
     return token_info.full_token, token
+
+
+@pytest.fixture(scope="session")
+async def _uploaded_fcs_rows(test_db, tmp_path_factory) -> tuple[dict, list[dict]]:
+    """Upload the mock FCS file once per session and keep its database rows.
+
+    The file and event array are stored in a session temporary directory,
+    not the application's upload_dir, and stay there for the whole
+    session; only the rows are lost when tables are emptied between
+    tests, so uploaded_fcs puts them back instead of uploading again.
+    """
+    upload_dir = str(tmp_path_factory.mktemp("uploads"))
+    filename, content = create_mock_fcs_file()
+    async with test_db() as session:
+        result = await FCSUsecase(session, upload_dir=upload_dir).upload_file(
+            filename, content, ["fcs:write"]
+        )
+        async with session.begin():
+            fcs_file = await session.get(FCSFile, UUID(result["file_id"]))
+            parameters = (await session.execute(
+                select(FCSParameter).where(FCSParameter.file_id == fcs_file.id)
+            )).scalars().all()
+
+    file_row = {
+        column.name: getattr(fcs_file, column.key)
+        for column in FCSFile.__table__.columns
+        if column.name != "uploaded_at"
+    }
+    parameter_rows = [
+        {column.name: getattr(param, column.key) for column in FCSParameter.__table__.columns}
+        for param in parameters
+    ]
+    return file_row, parameter_rows
+
+
+@pytest.fixture
+async def uploaded_fcs(session: AsyncSession, _uploaded_fcs_rows) -> UUID:
+    """Make the session's mock FCS file the latest upload; return its file_id.
+
+    For tests that read an uploaded file; uploading itself is tested
+    through the API in test_fcs_api.py.
+    """
+    file_row, parameter_rows = _uploaded_fcs_rows
+    await session.execute(insert(FCSFile), [file_row])
+    await session.execute(insert(FCSParameter), parameter_rows)
+    return file_row["id"]
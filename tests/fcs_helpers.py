@@ -0,0 +1,84 @@
+"""Mock FCS file and upload body shared by the FCS tests and fixtures."""
+import functools
+import struct
+
+# DATA segment of the mock file: 10 events x 2 parameters, little-endian uint32
+_DATA_PACKER = struct.Struct("<20I")
+# Segment offsets in the header: six right-justified 8-character fields
+_OFFSET_FMT = b"%8d%8d%8d%8d%8d%8d"
+
+
+@functools.lru_cache(maxsize=None)
+def create_mock_fcs_file(filename: str = "test.fcs") -> tuple[str, bytes]:
+    """Create a minimal valid FCS file for testing.
+
+    The result is cached per filename (the bytes are immutable).
+
+    Returns:
+        Tuple of (filename, file_content)
+    """
+    # Minimal FCS 3.0 file structure
+    header = b"FCS3.0    "
+
+    # TEXT segment with minimal required parameters; DATA ends at its last
+    # byte (512 + 80 - 1), no padding after it
+    text_segment = (
+        b"/$BEGINDATA/512/$ENDDATA/591/$BEGINSTEXT/0/$ENDSTEXT/0/"
+        b"$BYTEORD/1,2,3,4/$DATATYPE/I/$MODE/L/$NEXTDATA/0/"
+        b"$PAR/2/$TOT/10/"
+        b"$P1N/FSC-H/$P1S/FSC-H/$P1B/32/$P1R/1024/$P1E/0,0/$P1D/LIN/"
+        b"$P2N/SSC-H/$P2S/SSC-H/$P2B/32/$P2R/1024/$P2E/0,0/$P2D/LIN/"
+    )
+
+    # Pad header to 58 bytes
+    header_padding = b" " * (58 - len(header))
+    full_header = header + header_padding
+
+    # Create DATA segment (10 events, 2 parameters, 32-bit integers):
+    # FSC-H, SSC-H for each event
+    data_segment = _DATA_PACKER.pack(
+        *(value for i in range(10) for value in (100 + i * 10, 50 + i * 5))
+    )
+
+    # Create TEXT offsets in header
+    text_begin = 256
+    text_end = text_begin + len(text_segment)
+    data_begin = 512
+    data_end = data_begin + len(data_segment) - 1
+
+    # Update header with offsets
+    offset_bytes = _OFFSET_FMT % (text_begin, text_end, data_begin, data_end, 0, 0)
+    full_header = full_header[:10] + offset_bytes + full_header[58:]
+
+    # Combine all parts: header and TEXT each padded to 256 bytes
+    fcs_content = b"".join([
+        full_header,
+        b" " * (256 - len(full_header)),
+        text_segment,
+        b" " * (256 - len(text_segment)),
+        data_segment,
+    ])
+
+    return filename, fcs_content
+
+
+_MULTIPART_BOUNDARY = "fcs-test-boundary"
+MULTIPART_CONTENT_TYPE = f"multipart/form-data; boundary={_MULTIPART_BOUNDARY}"
+
+
+@functools.lru_cache(maxsize=None)
+def multipart_fcs_upload(filename: str = "test.fcs") -> bytes:
+    """Build the multipart/form-data body uploading the mock FCS file.
+
+    Sent as raw content with MULTIPART_CONTENT_TYPE, so httpx doesn't
+    re-encode the form on every request. Cached per filename.
+    """
+    filename, content = create_mock_fcs_file(filename)
+    boundary = _MULTIPART_BOUNDARY.encode()
+    return b"".join([
+        b"--", boundary, b"\r\n",
+        b'Content-Disposition: form-data; name="file"; filename="', filename.encode(), b'"\r\n',
+        b"Content-Type: application/octet-stream\r\n\r\n",
+        content,
+        b"\r\n--", boundary, b"--\r\n",
+    ])
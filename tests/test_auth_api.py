@@ -11,7 +11,9 @@ Status codes tested:
 """
 import pytest
 from httpx import AsyncClient
+from pydantic import ValidationError
 
+from app.domain.schemas import UserLoginRequest, UserRegisterRequest
 from app.models.user import User
 
 
@@ -78,51 +80,6 @@ class TestAuthRegister:
         assert response.status_code == 422
         assert response.json()["error"] == "Validation"
 
-    async def test_register_422_password_too_short(self, client: AsyncClient):
-        """Test registration with short password returns 422."""
-        response = await client.post(
-            "/api/v1/auth/register",
-            json={
-                "username": "newuser",
-                "email": "newuser@example.com",
-                "password": "short"  # Less than 8 characters
-            }
-        )
-        assert response.status_code == 422
-
-    async def test_register_422_missing_username(self, client: AsyncClient):
-        """Test registration without username returns 422."""
-        response = await client.post(
-            "/api/v1/auth/register",
-            json={
-                "email": "newuser@example.com",
-                "password": "password123"
-            }
-        )
-        assert response.status_code == 422
-
-    async def test_register_422_missing_email(self, client: AsyncClient):
-        """Test registration without email returns 422."""
-        response = await client.post(
-            "/api/v1/auth/register",
-            json={
-                "username": "newuser",
-                "password": "password123"
-            }
-        )
-        assert response.status_code == 422
-
-    async def test_register_422_missing_password(self, client: AsyncClient):
-        """Test registration without password returns 422."""
-        response = await client.post(
-            "/api/v1/auth/register",
-            json={
-                "username": "newuser",
-                "email": "newuser@example.com"
-            }
-        )
-        assert response.status_code == 422
-
 
 @pytest.mark.integration
 class TestAuthLogin:
@@ -181,12 +138,45 @@ class TestAuthLogin:
         )
         assert response.status_code == 422
 
-    async def test_login_422_missing_password(self, client: AsyncClient):
-        """Test login without password returns 422."""
-        response = await client.post(
-            "/api/v1/auth/login",
-            json={
-                "username": "user_a"
-            }
-        )
-        assert response.status_code == 422
+
+@pytest.mark.unit
+class TestAuthRequestValidation:
+    """Test request body validation directly against the schemas.
+
+    The HTTP 422 contract is covered once per endpoint above; the remaining
+    validation rules need no app, client or database.
+    """
+
+    VALID_REGISTER = {
+        "username": "newuser",
+        "email": "newuser@example.com",
+        "password": "password123",
+    }
+
+    def test_register_valid_payload(self):
+        """Test that a complete registration payload validates."""
+        UserRegisterRequest(**self.VALID_REGISTER)
+
+    @pytest.mark.parametrize(
+        "changes",
+        [
+            {"email": "invalid-email"},
+            {"password": "short"},  # Less than 8 characters
+        ],
+    )
+    def test_register_rejects_invalid_field(self, changes: dict):
+        """Test registration rejects an invalid email or short password."""
+        with pytest.raises(ValidationError):
+            UserRegisterRequest(**{**self.VALID_REGISTER, **changes})
+
+    @pytest.mark.parametrize("missing", ["username", "email", "password"])
+    def test_register_rejects_missing_field(self, missing: str):
+        """Test registration rejects a payload without a required field."""
+        payload = {k: v for k, v in self.VALID_REGISTER.items() if k != missing}
+        with pytest.raises(ValidationError):
+            UserRegisterRequest(**payload)
+
+    def test_login_rejects_missing_password(self):
+        """Test login rejects a payload without password."""
+        with pytest.raises(ValidationError):
+            UserLoginRequest(username="user_a")
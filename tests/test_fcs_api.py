@@ -7,65 +7,15 @@ Test cases:
 4. Permission checks for all endpoints
 5. 404 when no file exists
 """
+import asyncio
 import io
 import pytest
 from httpx import AsyncClient
 from uuid import UUID
 
 from app.models.user import User
-
-
-def create_mock_fcs_file(filename: str = "test.fcs") -> tuple[str, bytes]:
-    """Create a minimal valid FCS file for testing.
-
-    Returns:
-        Tuple of (filename, file_content)
-    """
-    # Minimal FCS 3.0 file structure
-    header = b"FCS3.0    "
-
-    # TEXT segment with minimal required parameters
-    text_segment = (
-        b"/$BEGINDATA/512/$ENDDATA/1024/$BEGINSTEXT/0/$ENDSTEXT/0/"
-        b"$BYTEORD/1,2,3,4/$DATATYPE/I/$MODE/L/$NEXTDATA/0/"
-        b"$PAR/2/$TOT/10/"
-        b"$P1N/FSC-H/$P1S/FSC-H/$P1B/32/$P1R/1024/$P1E/0,0/$P1D/LIN/"
-        b"$P2N/SSC-H/$P2S/SSC-H/$P2B/32/$P2R/1024/$P2E/0,0/$P2D/LIN/"
-    )
-
-    # Pad header to 58 bytes
-    header_padding = b" " * (58 - len(header))
-    full_header = header + header_padding
-
-    # Create TEXT offsets in header
-    text_begin = 256
-    text_end = text_begin + len(text_segment)
-    data_begin = 512
-    data_end = 1024
-
-    # Update header with offsets
-    offset_str = f"{text_begin:>8}{text_end:>8}{data_begin:>8}{data_end:>8}{0:>8}{0:>8}"
-    full_header = full_header[:10] + offset_str.encode() + full_header[58:]
-
-    # Pad to 256 bytes
-    full_header += b" " * (256 - len(full_header))
-
-    # Create DATA segment (10 events, 2 parameters, 32-bit integers)
-    import struct
-    data_segment = b""
-    for i in range(10):
-        # FSC-H value
-        data_segment += struct.pack("<I", 100 + i * 10)
-        # SSC-H value
-        data_segment += struct.pack("<I", 50 + i * 5)
-
-    # Pad data to reach expected size
-    data_padding = b"\x00" * (512 - len(data_segment))
-
-    # Combine all parts
-    fcs_content = full_header + text_segment + b" " * (256 - len(text_segment)) + data_segment + data_padding
-
-    return filename, fcs_content
+from tests.conftest import assert_forbidden
+from tests.fcs_helpers import MULTIPART_CONTENT_TYPE, multipart_fcs_upload
 
 
 @pytest.mark.fcs
@@ -78,13 +28,12 @@ class TestFCSUpload:
         """Test successful FCS file upload returns 200 with UUID file_id."""
         full_token, _ = await create_pat_token(user_a.id, scopes=["fcs:write"])
 
-        filename, content = create_mock_fcs_file("test_upload.fcs")
-        files = {"file": (filename, io.BytesIO(content), "application/octet-stream")}
+        filename = "test_upload.fcs"
 
         response = await client.post(
             "/api/v1/fcs/upload",
-            headers={"Authorization": f"Bearer {full_token}"},
-            files=files
+            headers={"Authorization": f"Bearer {full_token}", "Content-Type": MULTIPART_CONTENT_TYPE},
+            content=multipart_fcs_upload(filename)
         )
 
         assert response.status_code == 200
@@ -107,19 +56,13 @@ class TestFCSUpload:
         """Test uploading FCS file without fcs:write permission returns 403."""
         full_token, _ = await create_pat_token(user_a.id, scopes=["fcs:read"])
 
-        filename, content = create_mock_fcs_file()
-        files = {"file": (filename, io.BytesIO(content), "application/octet-stream")}
-
         response = await client.post(
             "/api/v1/fcs/upload",
-            headers={"Authorization": f"Bearer {full_token}"},
-            files=files
+            headers={"Authorization": f"Bearer {full_token}", "Content-Type": MULTIPART_CONTENT_TYPE},
+            content=multipart_fcs_upload()
         )
 
-        assert response.status_code == 403
-        data = response.json()
-        assert data["error"] == "Forbidden"
-        assert data["data"]["required_scope"] == "fcs:write"
+        assert_forbidden(response, "fcs:write")
 
     async def test_upload_invalid_file_extension(
         self, client: AsyncClient, user_a: User, create_pat_token
@@ -145,25 +88,25 @@ class TestFCSGlobalSharing:
     """Test that FCS files are globally shared among all users."""
 
     async def test_all_users_see_same_file(
-        self, client: AsyncClient, user_a: User, user_b: User, create_pat_token
+        self, client: AsyncClient, user_a: User, user_b: User, bulk_create_pat_tokens
     ):
         """Test that User B can see FCS file uploaded by User A."""
-        # User A uploads file
-        token_a, _ = await create_pat_token(user_a.id, scopes=["fcs:write", "fcs:read"])
-        filename, content = create_mock_fcs_file("shared_file.fcs")
-        files = {"file": (filename, io.BytesIO(content), "application/octet-stream")}
+        (token_a, _), (token_b, _) = await bulk_create_pat_tokens([
+            {"user_id": user_a.id, "scopes": ["fcs:write", "fcs:read"]},
+            # User B only has read permission
+            {"user_id": user_b.id, "scopes": ["fcs:read"]},
+        ])
 
+        # User A uploads file
         upload_response = await client.post(
             "/api/v1/fcs/upload",
-            headers={"Authorization": f"Bearer {token_a}"},
-            files=files
+            headers={"Authorization": f"Bearer {token_a}", "Content-Type": MULTIPART_CONTENT_TYPE},
+            content=multipart_fcs_upload("shared_file.fcs")
         )
         assert upload_response.status_code == 200
         uploaded_file_id = upload_response.json()["data"]["file_id"]
 
         # User B reads parameters with only read permission
-        token_b, _ = await create_pat_token(user_b.id, scopes=["fcs:read"])
-
         params_response = await client.get(
             "/api/v1/fcs/parameters",
             headers={"Authorization": f"Bearer {token_b}"}
@@ -188,23 +131,19 @@ class TestFCSLatestFileLogic:
         full_token, _ = await create_pat_token(user_a.id, scopes=["fcs:write", "fcs:read"])
 
         # Upload first file
-        filename1, content1 = create_mock_fcs_file("first_file.fcs")
-        files1 = {"file": (filename1, io.BytesIO(content1), "application/octet-stream")}
         response1 = await client.post(
             "/api/v1/fcs/upload",
-            headers={"Authorization": f"Bearer {full_token}"},
-            files=files1
+            headers={"Authorization": f"Bearer {full_token}", "Content-Type": MULTIPART_CONTENT_TYPE},
+            content=multipart_fcs_upload("first_file.fcs")
         )
         assert response1.status_code == 200
         file_id_1 = response1.json()["data"]["file_id"]
 
         # Upload second file
-        filename2, content2 = create_mock_fcs_file("second_file.fcs")
-        files2 = {"file": (filename2, io.BytesIO(content2), "application/octet-stream")}
         response2 = await client.post(
             "/api/v1/fcs/upload",
-            headers={"Authorization": f"Bearer {full_token}"},
-            files=files2
+            headers={"Authorization": f"Bearer {full_token}", "Content-Type": MULTIPART_CONTENT_TYPE},
+            content=multipart_fcs_upload("second_file.fcs")
         )
         assert response2.status_code == 200
         file_id_2 = response2.json()["data"]["file_id"]
@@ -228,19 +167,9 @@ class TestFCSPermissions:
     """Test FCS API permission requirements."""
 
     async def test_get_parameters_requires_fcs_read(
-        self, client: AsyncClient, user_a: User, create_pat_token
+        self, client: AsyncClient, user_a: User, create_pat_token, uploaded_fcs
     ):
         """Test GET /fcs/parameters requires fcs:read permission."""
-        # Upload a file first
-        token_write, _ = await create_pat_token(user_a.id, scopes=["fcs:write"])
-        filename, content = create_mock_fcs_file()
-        files = {"file": (filename, io.BytesIO(content), "application/octet-stream")}
-        await client.post(
-            "/api/v1/fcs/upload",
-            headers={"Authorization": f"Bearer {token_write}"},
-            files=files
-        )
-
         # Try to access with wrong permission
         token_wrong, _ = await create_pat_token(user_a.id, scopes=["workspacess:read"])
 
@@ -249,29 +178,18 @@ class TestFCSPermissions:
             headers={"Authorization": f"Bearer {token_wrong}"}
         )
 
-        assert response.status_code == 403
-        data = response.json()
-        assert data["error"] == "Forbidden"
-        assert data["data"]["required_scope"] == "fcs:read"
+        assert_forbidden(response, "fcs:read")
 
     async def test_get_events_requires_fcs_read(
-        self, client: AsyncClient, user_a: User, create_pat_token
+        self, client: AsyncClient, user_a: User, create_pat_token, uploaded_fcs
     ):
         """Test GET /fcs/events requires fcs:read permission."""
-        # Upload a file first
-        token_write, _ = await create_pat_token(user_a.id, scopes=["fcs:write", "fcs:read"])
-        filename, content = create_mock_fcs_file()
-        files = {"file": (filename, io.BytesIO(content), "application/octet-stream")}
-        await client.post(
-            "/api/v1/fcs/upload",
-            headers={"Authorization": f"Bearer {token_write}"},
-            files=files
-        )
+        token_read, _ = await create_pat_token(user_a.id, scopes=["fcs:read"])
 
         # Access with correct permission
         response = await client.get(
             "/api/v1/fcs/events?limit=5",
-            headers={"Authorization": f"Bearer {token_write}"}
+            headers={"Authorization": f"Bearer {token_read}"}
         )
 
         assert response.status_code == 200
@@ -280,325 +198,100 @@ class TestFCSPermissions:
         assert len(data["events"]) <= 5
 
     async def test_get_statistics_requires_fcs_analyze(
-        self, client: AsyncClient, user_a: User, create_pat_token
+        self, client: AsyncClient, user_a: User, bulk_create_pat_tokens, uploaded_fcs
     ):
         """Test GET /fcs/statistics requires fcs:analyze permission."""
-        # Upload a file
-        token_write, _ = await create_pat_token(user_a.id, scopes=["fcs:write"])
-        filename, content = create_mock_fcs_file()
-        files = {"file": (filename, io.BytesIO(content), "application/octet-stream")}
-        await client.post(
-            "/api/v1/fcs/upload",
-            headers={"Authorization": f"Bearer {token_write}"},
-            files=files
-        )
-
-        # Try with only read permission
-        token_read, _ = await create_pat_token(user_a.id, scopes=["fcs:read"])
+        (token_read, _), (token_analyze, _) = await bulk_create_pat_tokens([
+            {"user_id": user_a.id, "scopes": ["fcs:read"]},
+            {"user_id": user_a.id, "scopes": ["fcs:analyze"]},
+        ])
 
-        response = await client.get(
-            "/api/v1/fcs/statistics",
-            headers={"Authorization": f"Bearer {token_read}"}
+        read_response, analyze_response = await asyncio.gather(
+            client.get("/api/v1/fcs/statistics", headers={"Authorization": f"Bearer {token_read}"}),
+            client.get("/api/v1/fcs/statistics", headers={"Authorization": f"Bearer {token_analyze}"}),
         )
 
-        assert response.status_code == 403
-        data = response.json()
+        # Try with only read permission
+        assert read_response.status_code == 403
+        data = read_response.json()
         assert data["error"] == "Forbidden"
         assert data["data"]["required_scope"] == "fcs:analyze"
 
         # Access with analyze permission
-        token_analyze, _ = await create_pat_token(user_a.id, scopes=["fcs:analyze"])
-
-        response = await client.get(
-            "/api/v1/fcs/statistics",
-            headers={"Authorization": f"Bearer {token_analyze}"}
-        )
-
-        assert response.status_code == 200
-        data = response.json()["data"]
+        assert analyze_response.status_code == 200
+        data = analyze_response.json()["data"]
         assert "statistics" in data
         assert len(data["statistics"]) == 2  # 2 parameters
 
 
-@pytest.mark.fcs
-class TestFCSUpload401:
-    """Test 401 Unauthorized scenarios for FCS upload."""
+# (method, path, required_scope) for every FCS endpoint
+ENDPOINTS = [
+    pytest.param("POST", "/api/v1/fcs/upload", "fcs:write", id="upload"),
+    pytest.param("GET", "/api/v1/fcs/parameters", "fcs:read", id="parameters"),
+    pytest.param("GET", "/api/v1/fcs/events", "fcs:read", id="events"),
+    pytest.param("GET", "/api/v1/fcs/statistics", "fcs:analyze", id="statistics"),
+]
 
-    async def test_upload_fcs_401_no_authorization_header(self, client: AsyncClient):
-        """Test uploading FCS file without Authorization header returns 401."""
-        filename, content = create_mock_fcs_file()
-        files = {"file": (filename, io.BytesIO(content), "application/octet-stream")}
 
-        response = await client.post("/api/v1/fcs/upload", files=files)
-        assert response.status_code == 401
-        assert response.json()["error"] == "Unauthorized"
-
-    async def test_upload_fcs_401_invalid_token(self, client: AsyncClient):
-        """Test uploading FCS file with invalid PAT token returns 401."""
-        filename, content = create_mock_fcs_file()
-        files = {"file": (filename, io.BytesIO(content), "application/octet-stream")}
-
-        response = await client.post(
-            "/api/v1/fcs/upload",
-            headers={"Authorization": "Bearer pat_invalid_token"},
-            files=files
-        )
-        assert response.status_code == 401
-        assert response.json()["error"] == "Unauthorized"
-
-    async def test_upload_fcs_401_expired_token(
-        self, client: AsyncClient, session, user_a: User
-    ):
-        """Test uploading FCS file with expired PAT token returns 401."""
-        from datetime import datetime, timedelta, timezone
-        from app.domain.token_service import create_token_info
-        from app.models.token import Token
-
-        token_info = create_token_info()
-        expired_at = datetime.now(timezone.utc) - timedelta(days=1)
-
-        token = Token(
-            user_id=user_a.id,
-            name="Expired Token",
-            token_hash=token_info.token_hash,
-            token_prefix=token_info.token_prefix,
-            scopes=["fcs:write"],
-            expires_at=expired_at,
-        )
-        session.add(token)
-        await session.commit()
-        await session.refresh(token)
-
-        filename, content = create_mock_fcs_file()
-        files = {"file": (filename, io.BytesIO(content), "application/octet-stream")}
-
-        response = await client.post(
-            "/api/v1/fcs/upload",
-            headers={"Authorization": f"Bearer {token_info.full_token}"},
-            files=files
-        )
-        assert response.status_code == 401
-        assert "expired" in response.json()["message"].lower()
-
-    async def test_upload_fcs_401_revoked_token(
-        self, client: AsyncClient, user_a: User, create_pat_token
-    ):
-        """Test uploading FCS file with revoked PAT token returns 401."""
-        full_token, _ = await create_pat_token(
-            user_a.id,
-            scopes=["fcs:write"],
-            is_revoked=True
-        )
-
-        filename, content = create_mock_fcs_file()
-        files = {"file": (filename, io.BytesIO(content), "application/octet-stream")}
-
-        response = await client.post(
-            "/api/v1/fcs/upload",
-            headers={"Authorization": f"Bearer {full_token}"},
-            files=files
-        )
-        assert response.status_code == 401
-        assert "revoked" in response.json()["message"].lower()
+async def _request(client: AsyncClient, method: str, path: str, token: str | None = None):
+    """Send a request to an FCS endpoint, with the upload body for POST."""
+    headers = {} if token is None else {"Authorization": f"Bearer {token}"}
+    if method == "POST":
+        headers["Content-Type"] = MULTIPART_CONTENT_TYPE
+        return await client.request(method, path, headers=headers, content=multipart_fcs_upload())
+    return await client.request(method, path, headers=headers)
 
 
 @pytest.mark.fcs
-class TestFCSParameters401:
-    """Test 401 Unauthorized scenarios for FCS parameters endpoint."""
-
-    async def test_get_parameters_401_no_authorization_header(self, client: AsyncClient):
-        """Test getting FCS parameters without Authorization header returns 401."""
-        response = await client.get("/api/v1/fcs/parameters")
-        assert response.status_code == 401
-        assert response.json()["error"] == "Unauthorized"
-
-    async def test_get_parameters_401_invalid_token(self, client: AsyncClient):
-        """Test getting FCS parameters with invalid PAT token returns 401."""
-        response = await client.get(
-            "/api/v1/fcs/parameters",
-            headers={"Authorization": "Bearer pat_invalid_token"}
-        )
-        assert response.status_code == 401
-        assert response.json()["error"] == "Unauthorized"
-
-    async def test_get_parameters_401_expired_token(
-        self, client: AsyncClient, session, user_a: User
-    ):
-        """Test getting FCS parameters with expired PAT token returns 401."""
-        from datetime import datetime, timedelta, timezone
-        from app.domain.token_service import create_token_info
-        from app.models.token import Token
-
-        token_info = create_token_info()
-        expired_at = datetime.now(timezone.utc) - timedelta(days=1)
-
-        token = Token(
-            user_id=user_a.id,
-            name="Expired Token",
-            token_hash=token_info.token_hash,
-            token_prefix=token_info.token_prefix,
-            scopes=["fcs:read"],
-            expires_at=expired_at,
-        )
-        session.add(token)
-        await session.commit()
-        await session.refresh(token)
-
-        response = await client.get(
-            "/api/v1/fcs/parameters",
-            headers={"Authorization": f"Bearer {token_info.full_token}"}
-        )
-        assert response.status_code == 401
-        assert "expired" in response.json()["message"].lower()
+class TestFCS401:
+    """Test 401 Unauthorized scenarios for every FCS endpoint."""
 
-    async def test_get_parameters_401_revoked_token(
-        self, client: AsyncClient, user_a: User, create_pat_token
+    @pytest.mark.parametrize("method,path,required_scope", ENDPOINTS)
+    async def test_401_no_authorization_header(
+        self, client: AsyncClient, method: str, path: str, required_scope: str
     ):
-        """Test getting FCS parameters with revoked PAT token returns 401."""
-        full_token, _ = await create_pat_token(
-            user_a.id,
-            scopes=["fcs:read"],
-            is_revoked=True
-        )
-
-        response = await client.get(
-            "/api/v1/fcs/parameters",
-            headers={"Authorization": f"Bearer {full_token}"}
-        )
-        assert response.status_code == 401
-        assert "revoked" in response.json()["message"].lower()
-
-
-@pytest.mark.fcs
-class TestFCSEvents401:
-    """Test 401 Unauthorized scenarios for FCS events endpoint."""
-
-    async def test_get_events_401_no_authorization_header(self, client: AsyncClient):
-        """Test getting FCS events without Authorization header returns 401."""
-        response = await client.get("/api/v1/fcs/events")
+        """Test a request without Authorization header returns 401."""
+        response = await _request(client, method, path)
         assert response.status_code == 401
         assert response.json()["error"] == "Unauthorized"
 
-    async def test_get_events_401_invalid_token(self, client: AsyncClient):
-        """Test getting FCS events with invalid PAT token returns 401."""
-        response = await client.get(
-            "/api/v1/fcs/events",
-            headers={"Authorization": "Bearer pat_invalid_token"}
-        )
-        assert response.status_code == 401
-        assert response.json()["error"] == "Unauthorized"
-
-    async def test_get_events_401_expired_token(
-        self, client: AsyncClient, session, user_a: User
+    @pytest.mark.parametrize("method,path,required_scope", ENDPOINTS)
+    async def test_401_invalid_token(
+        self, client: AsyncClient, method: str, path: str, required_scope: str
     ):
-        """Test getting FCS events with expired PAT token returns 401."""
-        from datetime import datetime, timedelta, timezone
-        from app.domain.token_service import create_token_info
-        from app.models.token import Token
-
-        token_info = create_token_info()
-        expired_at = datetime.now(timezone.utc) - timedelta(days=1)
-
-        token = Token(
-            user_id=user_a.id,
-            name="Expired Token",
-            token_hash=token_info.token_hash,
-            token_prefix=token_info.token_prefix,
-            scopes=["fcs:read"],
-            expires_at=expired_at,
-        )
-        session.add(token)
-        await session.commit()
-        await session.refresh(token)
-
-        response = await client.get(
-            "/api/v1/fcs/events",
-            headers={"Authorization": f"Bearer {token_info.full_token}"}
-        )
-        assert response.status_code == 401
-        assert "expired" in response.json()["message"].lower()
-
-    async def test_get_events_401_revoked_token(
-        self, client: AsyncClient, user_a: User, create_pat_token
-    ):
-        """Test getting FCS events with revoked PAT token returns 401."""
-        full_token, _ = await create_pat_token(
-            user_a.id,
-            scopes=["fcs:read"],
-            is_revoked=True
-        )
-
-        response = await client.get(
-            "/api/v1/fcs/events",
-            headers={"Authorization": f"Bearer {full_token}"}
-        )
-        assert response.status_code == 401
-        assert "revoked" in response.json()["message"].lower()
-
-
-@pytest.mark.fcs
-class TestFCSStatistics401:
-    """Test 401 Unauthorized scenarios for FCS statistics endpoint."""
-
-    async def test_get_statistics_401_no_authorization_header(self, client: AsyncClient):
-        """Test getting FCS statistics without Authorization header returns 401."""
-        response = await client.get("/api/v1/fcs/statistics")
-        assert response.status_code == 401
-        assert response.json()["error"] == "Unauthorized"
-
-    async def test_get_statistics_401_invalid_token(self, client: AsyncClient):
-        """Test getting FCS statistics with invalid PAT token returns 401."""
-        response = await client.get(
-            "/api/v1/fcs/statistics",
-            headers={"Authorization": "Bearer pat_invalid_token"}
-        )
+        """Test a request with an invalid PAT token returns 401."""
+        response = await _request(client, method, path, "pat_invalid_token")
         assert response.status_code == 401
         assert response.json()["error"] == "Unauthorized"
 
-    async def test_get_statistics_401_expired_token(
-        self, client: AsyncClient, session, user_a: User
+    @pytest.mark.parametrize("method,path,required_scope", ENDPOINTS)
+    async def test_401_expired_token(
+        self, client: AsyncClient, user_a: User, create_pat_token,
+        method: str, path: str, required_scope: str,
     ):
-        """Test getting FCS statistics with expired PAT token returns 401."""
-        from datetime import datetime, timedelta, timezone
-        from app.domain.token_service import create_token_info
-        from app.models.token import Token
-
-        token_info = create_token_info()
-        expired_at = datetime.now(timezone.utc) - timedelta(days=1)
-
-        token = Token(
-            user_id=user_a.id,
-            name="Expired Token",
-            token_hash=token_info.token_hash,
-            token_prefix=token_info.token_prefix,
-            scopes=["fcs:analyze"],
-            expires_at=expired_at,
+        """Test a request with an expired PAT token returns 401."""
+        # Expired 1 day ago
+        full_token, _ = await create_pat_token(
+            user_a.id, scopes=[required_scope], name="Expired Token", expires_in_days=-1
         )
-        session.add(token)
-        await session.commit()
-        await session.refresh(token)
 
-        response = await client.get(
-            "/api/v1/fcs/statistics",
-            headers={"Authorization": f"Bearer {token_info.full_token}"}
-        )
+        response = await _request(client, method, path, full_token)
         assert response.status_code == 401
         assert "expired" in response.json()["message"].lower()
 
-    async def test_get_statistics_401_revoked_token(
-        self, client: AsyncClient, user_a: User, create_pat_token
+    @pytest.mark.parametrize("method,path,required_scope", ENDPOINTS)
+    async def test_401_revoked_token(
+        self, client: AsyncClient, user_a: User, create_pat_token,
+        method: str, path: str, required_scope: str,
     ):
-        """Test getting FCS statistics with revoked PAT token returns 401."""
+        """Test a request with a revoked PAT token returns 401."""
         full_token, _ = await create_pat_token(
             user_a.id,
-            scopes=["fcs:analyze"],
+            scopes=[required_scope],
             is_revoked=True
         )
 
-        response = await client.get(
-            "/api/v1/fcs/statistics",
-            headers={"Authorization": f"Bearer {full_token}"}
-        )
+        response = await _request(client, method, path, full_token)
         assert response.status_code == 401
         assert "revoked" in response.json()["message"].lower()
 
@@ -608,54 +301,66 @@ class TestFCSEventsPagination:
     """Test pagination parameters for FCS events endpoint."""
 
     async def test_get_events_with_valid_pagination(
-        self, client: AsyncClient, user_a: User, create_pat_token
+        self, client: AsyncClient, user_a: User, create_pat_token, uploaded_fcs
     ):
         """Test GET /fcs/events with valid limit and offset."""
-        # Upload a file first
-        token, _ = await create_pat_token(user_a.id, scopes=["fcs:write", "fcs:read"])
-        filename, content = create_mock_fcs_file()
-        files = {"file": (filename, io.BytesIO(content), "application/octet-stream")}
-        await client.post(
-            "/api/v1/fcs/upload",
-            headers={"Authorization": f"Bearer {token}"},
-            files=files
+        token, _ = await create_pat_token(user_a.id, scopes=["fcs:read"])
+
+        headers = {"Authorization": f"Bearer {token}"}
+        limit_response, response = await asyncio.gather(
+            client.get("/api/v1/fcs/events?limit=5", headers=headers),
+            client.get("/api/v1/fcs/events?limit=3&offset=2", headers=headers),
         )
 
         # Test with limit
-        response = await client.get(
-            "/api/v1/fcs/events?limit=5",
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        assert response.status_code == 200
-        data = response.json()["data"]
+        assert limit_response.status_code == 200
+        data = limit_response.json()["data"]
         assert data["limit"] == 5
         assert len(data["events"]) <= 5
 
         # Test with limit and offset
-        response = await client.get(
-            "/api/v1/fcs/events?limit=3&offset=2",
-            headers={"Authorization": f"Bearer {token}"}
-        )
         assert response.status_code == 200
         data = response.json()["data"]
         assert data["limit"] == 3
         assert data["offset"] == 2
 
-    async def test_get_events_422_invalid_limit(
+    async def test_get_events_columns_orient(
+        self, client: AsyncClient, user_a: User, create_pat_token, uploaded_fcs
+    ):
+        """Test GET /fcs/events?orient=columns returns names once and value rows."""
+        token, _ = await create_pat_token(user_a.id, scopes=["fcs:read"])
+
+        headers = {"Authorization": f"Bearer {token}"}
+        records_response, columns_response = await asyncio.gather(
+            client.get("/api/v1/fcs/events?limit=3&offset=2", headers=headers),
+            client.get("/api/v1/fcs/events?limit=3&offset=2&orient=columns", headers=headers),
+        )
+        assert columns_response.status_code == 200
+        data = columns_response.json()["data"]
+        assert data["columns"] == ["FSC-H", "SSC-H"]
+        assert len(data["events"]) == 3
+
+        # Same values as the default records layout
+        records = records_response.json()["data"]["events"]
+        assert [dict(zip(data["columns"], row)) for row in data["events"]] == records
+
+    async def test_get_events_422_invalid_orient(
         self, client: AsyncClient, user_a: User, create_pat_token
     ):
-        """Test GET /fcs/events with invalid limit returns 422."""
+        """Test GET /fcs/events with unknown orient returns 422."""
         token, _ = await create_pat_token(user_a.id, scopes=["fcs:read"])
 
-        # Upload a file first
-        token_write, _ = await create_pat_token(user_a.id, scopes=["fcs:write"])
-        filename, content = create_mock_fcs_file()
-        files = {"file": (filename, io.BytesIO(content), "application/octet-stream")}
-        await client.post(
-            "/api/v1/fcs/upload",
-            headers={"Authorization": f"Bearer {token_write}"},
-            files=files
+        response = await client.get(
+            "/api/v1/fcs/events?orient=split",
+            headers={"Authorization": f"Bearer {token}"}
         )
+        assert response.status_code == 422
+
+    async def test_get_events_422_invalid_limit(
+        self, client: AsyncClient, user_a: User, create_pat_token, uploaded_fcs
+    ):
+        """Test GET /fcs/events with invalid limit returns 422."""
+        token, _ = await create_pat_token(user_a.id, scopes=["fcs:read"])
 
         # Test negative limit
         response = await client.get(
@@ -679,21 +384,11 @@ class TestFCSEventsPagination:
         assert response.status_code == 422
 
     async def test_get_events_422_invalid_offset(
-        self, client: AsyncClient, user_a: User, create_pat_token
+        self, client: AsyncClient, user_a: User, create_pat_token, uploaded_fcs
     ):
         """Test GET /fcs/events with invalid offset returns 422."""
         token, _ = await create_pat_token(user_a.id, scopes=["fcs:read"])
 
-        # Upload a file first
-        token_write, _ = await create_pat_token(user_a.id, scopes=["fcs:write"])
-        filename, content = create_mock_fcs_file()
-        files = {"file": (filename, io.BytesIO(content), "application/octet-stream")}
-        await client.post(
-            "/api/v1/fcs/upload",
-            headers={"Authorization": f"Bearer {token_write}"},
-            files=files
-        )
-
         # Test negative offset
         response = await client.get(
             "/api/v1/fcs/events?offset=-1",
@@ -706,44 +401,21 @@ class TestFCSEventsPagination:
 class TestFCSNoFileScenarios:
     """Test FCS API behavior when no file exists."""
 
-    async def test_get_parameters_404_no_file(
-        self, client: AsyncClient, user_a: User, create_pat_token
-    ):
-        """Test GET /fcs/parameters returns 404 when no file uploaded."""
-        full_token, _ = await create_pat_token(user_a.id, scopes=["fcs:read"])
-
-        response = await client.get(
-            "/api/v1/fcs/parameters",
-            headers={"Authorization": f"Bearer {full_token}"}
-        )
-
-        assert response.status_code == 404
-        data = response.json()
-        assert data["error"] == "NotFound"
-        assert "No FCS file found" in data["message"]
-
-    async def test_get_events_404_no_file(
-        self, client: AsyncClient, user_a: User, create_pat_token
-    ):
-        """Test GET /fcs/events returns 404 when no file uploaded."""
-        full_token, _ = await create_pat_token(user_a.id, scopes=["fcs:read"])
-
-        response = await client.get(
-            "/api/v1/fcs/events",
-            headers={"Authorization": f"Bearer {full_token}"}
-        )
-
-        assert response.status_code == 404
-
-    async def test_get_statistics_404_no_file(
+    async def test_get_endpoints_404_no_file(
         self, client: AsyncClient, user_a: User, create_pat_token
     ):
-        """Test GET /fcs/statistics returns 404 when no file uploaded."""
+        """Test every FCS read endpoint returns 404 when no file uploaded."""
+        # fcs:analyze includes fcs:read, so one token covers all three
         full_token, _ = await create_pat_token(user_a.id, scopes=["fcs:analyze"])
+        headers = {"Authorization": f"Bearer {full_token}"}
+        paths = ["/api/v1/fcs/parameters", "/api/v1/fcs/events", "/api/v1/fcs/statistics"]
 
-        response = await client.get(
-            "/api/v1/fcs/statistics",
-            headers={"Authorization": f"Bearer {full_token}"}
+        responses = await asyncio.gather(
+            *(client.get(path, headers=headers) for path in paths)
         )
 
-        assert response.status_code == 404
+        for path, response in zip(paths, responses):
+            assert response.status_code == 404, path
+            data = response.json()
+            assert data["error"] == "NotFound"
+            assert "No FCS file found" in data["message"]
@@ -11,12 +11,17 @@ Test cases:
 NOTE: These tests should be run separately from other tests to avoid rate limit
 pollution. Use: pytest tests/test_rate_limiting.py
 """
+import asyncio
 import pytest
 import importlib
 from httpx import AsyncClient
 
 from app.models.user import User
 
+# The tests share one limiter and depend on running in order, so xdist keeps
+# the whole module on a single worker
+pytestmark = pytest.mark.xdist_group("rate_limiting")
+
 
 @pytest.mark.unit
 class TestRateLimitConfiguration:
@@ -70,6 +75,7 @@ class TestRateLimitConfiguration:
         # After reload, limiter is a new instance, but app.state.limiter still points to old one
         from app.main import app
         from app.common.rate_limit import limiter
+        limiter.enabled = app.state.limiter.enabled
         app.state.limiter = limiter
 
 
@@ -93,12 +99,7 @@ class TestRateLimitSharedCounter:
         limiter.enabled = True
 
         # Reset rate limiter storage
-        if hasattr(limiter, '_limiter') and hasattr(limiter._limiter, 'storage'):
-            storage = limiter._limiter.storage
-            if hasattr(storage, 'reset'):
-                storage.reset()
-            elif hasattr(storage, 'storage'):
-                storage.storage.clear()
+        limiter._limiter.storage.reset()
 
         try:
             limit = settings.rate_limit_per_minute
@@ -153,10 +154,7 @@ class TestRateLimitSharedCounter:
         limiter.enabled = True
 
         # Reset storage
-        if hasattr(limiter, '_limiter') and hasattr(limiter._limiter, 'storage'):
-            storage = limiter._limiter.storage
-            if hasattr(storage, 'storage'):
-                storage.storage.clear()
+        limiter._limiter.storage.reset()
 
         try:
             limit = settings.rate_limit_per_minute
@@ -209,31 +207,27 @@ class TestRateLimitEnforcement:
         limiter.enabled = True
 
         # Reset storage
-        if hasattr(limiter, '_limiter') and hasattr(limiter._limiter, 'storage'):
-            storage = limiter._limiter.storage
-            if hasattr(storage, 'storage'):
-                storage.storage.clear()
+        limiter._limiter.storage.reset()
 
         try:
             limit = settings.rate_limit_per_minute
 
-            # Make (limit + 10) requests to ensure we hit the limit
-            rate_limited = False
-            for i in range(limit + 10):
-                response = await client.post(
+            # Send (limit + 10) requests concurrently to ensure we hit the limit
+            responses = await asyncio.gather(*(
+                client.post(
                     "/api/v1/auth/login",
                     json={"username": "testuser", "password": "testpass"}
                 )
+                for _ in range(limit + 10)
+            ))
 
-                if response.status_code == 429:
-                    data = response.json()
-                    assert data["success"] is False
-                    assert data["error"] == "Too Many Requests"
-                    assert "retry_after" in data["data"]
-                    rate_limited = True
-                    break
+            limited = [r for r in responses if r.status_code == 429]
+            assert limited, f"Rate limit should trigger after {limit} requests"
 
-            assert rate_limited, f"Rate limit should trigger after {limit} requests"
+            data = limited[0].json()
+            assert data["success"] is False
+            assert data["error"] == "Too Many Requests"
+            assert "retry_after" in data["data"]
 
         finally:
             limiter.enabled = original_enabled
@@ -247,10 +241,7 @@ class TestRateLimitEnforcement:
         limiter.enabled = True
 
         # Reset storage
-        if hasattr(limiter, '_limiter') and hasattr(limiter._limiter, 'storage'):
-            storage = limiter._limiter.storage
-            if hasattr(storage, 'storage'):
-                storage.storage.clear()
+        limiter._limiter.storage.reset()
 
         try:
             limit = settings.rate_limit_per_minute
@@ -292,10 +283,7 @@ class TestRateLimitResponseFormat:
         limiter.enabled = True
 
         # Reset storage
-        if hasattr(limiter, '_limiter') and hasattr(limiter._limiter, 'storage'):
-            storage = limiter._limiter.storage
-            if hasattr(storage, 'storage'):
-                storage.storage.clear()
+        limiter._limiter.storage.reset()
 
         try:
             limit = settings.rate_limit_per_minute
@@ -341,10 +329,7 @@ class TestRateLimitResponseFormat:
         limiter.enabled = True
 
         # Reset storage
-        if hasattr(limiter, '_limiter') and hasattr(limiter._limiter, 'storage'):
-            storage = limiter._limiter.storage
-            if hasattr(storage, 'storage'):
-                storage.storage.clear()
+        limiter._limiter.storage.reset()
 
         try:
             limit = settings.rate_limit_per_minute
@@ -381,10 +366,7 @@ class TestRateLimitCounting:
         limiter.enabled = True
 
         # Reset storage
-        if hasattr(limiter, '_limiter') and hasattr(limiter._limiter, 'storage'):
-            storage = limiter._limiter.storage
-            if hasattr(storage, 'storage'):
-                storage.storage.clear()
+        limiter._limiter.storage.reset()
 
         try:
             limit = settings.rate_limit_per_minute
@@ -413,10 +395,7 @@ class TestRateLimitCounting:
         limiter.enabled = True
 
         # Reset storage
-        if hasattr(limiter, '_limiter') and hasattr(limiter._limiter, 'storage'):
-            storage = limiter._limiter.storage
-            if hasattr(storage, 'storage'):
-                storage.storage.clear()
+        limiter._limiter.storage.reset()
 
         try:
             limit = settings.rate_limit_per_minute
@@ -446,10 +425,7 @@ class TestRateLimitCounting:
         limiter.enabled = True
 
         # Reset storage
-        if hasattr(limiter, '_limiter') and hasattr(limiter._limiter, 'storage'):
-            storage = limiter._limiter.storage
-            if hasattr(storage, 'storage'):
-                storage.storage.clear()
+        limiter._limiter.storage.reset()
 
         try:
             limit = settings.rate_limit_per_minute
@@ -18,6 +18,7 @@ from datetime import datetime, timedelta, timezone
 from app.models.user import User
 from app.models.token import Token
 from app.domain.token_service import create_token_info
+from tests.conftest import assert_forbidden
 
 
 @pytest.mark.security
@@ -323,6 +324,24 @@ class TestTokenAuthentication:
         assert response.json()["error"] == "Unauthorized"
         assert response.json()["message"] == "Invalid token"
 
+    async def test_malformed_token_is_rejected_before_hashing(
+        self, client: AsyncClient, monkeypatch
+    ):
+        """Test that a token failing the format check is never hashed or looked up."""
+        from app.usecase import auth_usecase
+
+        def fail_hash(token: str) -> bytes:
+            pytest.fail(f"malformed token was hashed: {token}")
+
+        monkeypatch.setattr(auth_usecase, "hash_token", fail_hash)
+
+        response = await client.get(
+            "/api/v1/workspacess",
+            headers={"Authorization": "Bearer pat_invalid_token"}
+        )
+        assert response.status_code == 401
+        assert response.json()["message"] == "Invalid token"
+
     async def test_prefix_token_cannot_authenticate(
         self, client: AsyncClient, session: AsyncSession,
         user_a: User, user_a_jwt: str
@@ -410,7 +429,6 @@ class TestTokenExpiration:
         )
         session.add(token)
         await session.commit()
-        await session.refresh(token)
 
         # Try to use expired token
         response = await client.get(
@@ -439,7 +457,6 @@ class TestTokenExpiration:
         )
         session.add(token)
         await session.commit()
-        await session.refresh(token)
 
         # Should still work
         response = await client.get(
@@ -572,8 +589,39 @@ class TestValidToken:
             "/api/v1/workspacess",
             headers={"Authorization": f"Bearer {full_token}"}
         )
-        assert response.status_code == 403
-        data = response.json()
-        assert data["error"] == "Forbidden"
-        assert data["data"]["required_scope"] == "workspacess:write"
-        assert data["data"]["your_scopes"] == ["workspacess:read"]
+        assert_forbidden(response, "workspacess:write", ["workspacess:read"])
+
+
+@pytest.mark.unit
+class TestTokenCache:
+    """Test the process-local PAT lookup cache."""
+
+    def test_expired_entry_is_not_returned(self, monkeypatch):
+        """Test entries stop being served once their TTL has passed."""
+        from app.common import token_cache as token_cache_module
+        from app.common.token_cache import TokenCache
+
+        now = 1000.0
+        monkeypatch.setattr(token_cache_module.time, "monotonic", lambda: now)
+        cache = TokenCache(maxsize=10, ttl=30)
+        token, user = Token(name="Cached"), User(username="cached")
+        cache.set(b"hash", token, user)
+
+        assert cache.get(b"hash") == (token, user)
+        now += 30
+        assert cache.get(b"hash") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test a full cache evicts the entry used least recently."""
+        from app.common.token_cache import TokenCache
+
+        cache = TokenCache(maxsize=2, ttl=30)
+        user = User(username="cached")
+        for key in (b"a", b"b"):
+            cache.set(key, Token(name=key.decode()), user)
+        cache.get(b"a")
+        cache.set(b"c", Token(name="c"), user)
+
+        assert cache.get(b"b") is None
+        assert cache.get(b"a") is not None
+        assert cache.get(b"c") is not None
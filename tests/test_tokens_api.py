@@ -21,6 +21,7 @@ from datetime import datetime, timedelta, timezone
 from uuid import uuid4, UUID
 from httpx import AsyncClient
 
+from app.common.last_used_flusher import flush_last_used
 from app.models.user import User
 from app.models.token import Token
 
@@ -58,6 +59,35 @@ class TestCreateToken:
         assert "expires_at" in data
         assert "created_at" in data
 
+    async def test_create_token_retries_on_hash_collision(
+        self, client: AsyncClient, user_a: User, user_a_jwt: str,
+        create_pat_token, monkeypatch
+    ):
+        """Test that a token hash collision is retried with a fresh token."""
+        from app.domain import token_service
+        from app.usecase import token_usecase
+
+        existing_token, _ = await create_pat_token(user_a.id, scopes=["workspacess:read"])
+        colliding = token_service.TokenInfo(
+            full_token=existing_token,
+            token_hash=token_service.hash_token(existing_token),
+            token_prefix=existing_token[:12],
+        )
+        generated = iter([colliding])
+        monkeypatch.setattr(
+            token_usecase,
+            "create_token_info",
+            lambda: next(generated, None) or token_service.create_token_info(),
+        )
+
+        response = await client.post(
+            "/api/v1/tokens",
+            headers={"Authorization": f"Bearer {user_a_jwt}"},
+            json={"name": "Retry Token", "scopes": ["workspacess:read"]}
+        )
+        assert response.status_code == 200
+        assert response.json()["data"]["token"] != existing_token
+
     async def test_create_token_401_no_authorization_header(
         self, client: AsyncClient
     ):
@@ -189,12 +219,14 @@ class TestListTokens:
     """Test GET /api/v1/tokens endpoint."""
 
     async def test_list_tokens_200_success(
-        self, client: AsyncClient, user_a: User, user_a_jwt: str, create_pat_token
+        self, client: AsyncClient, user_a: User, user_a_jwt: str, bulk_create_pat_tokens
     ):
         """Test listing tokens returns 200 with token list (prefix only)."""
         # Create some tokens
-        await create_pat_token(user_a.id, scopes=["workspacess:read"], name="Token 1")
-        await create_pat_token(user_a.id, scopes=["fcs:read"], name="Token 2")
+        await bulk_create_pat_tokens([
+            {"user_id": user_a.id, "scopes": ["workspacess:read"], "name": "Token 1"},
+            {"user_id": user_a.id, "scopes": ["fcs:read"], "name": "Token 2"},
+        ])
 
         response = await client.get(
             "/api/v1/tokens",
@@ -212,6 +244,46 @@ class TestListTokens:
             assert len(token["token_prefix"]) == 12  # pat_ + 8 chars
             assert "token" not in token  # Full token should not be exposed
 
+    async def test_list_tokens_cursor_pagination(
+        self, client: AsyncClient, user_a: User, user_a_jwt: str, bulk_create_pat_tokens
+    ):
+        """Test paging through tokens with limit and next_cursor."""
+        await bulk_create_pat_tokens([
+            {"user_id": user_a.id, "scopes": ["workspacess:read"], "name": f"Token {i}"}
+            for i in range(3)
+        ])
+
+        response = await client.get(
+            "/api/v1/tokens?limit=2",
+            headers={"Authorization": f"Bearer {user_a_jwt}"}
+        )
+        assert response.status_code == 200
+        first_page = response.json()["data"]
+        assert len(first_page["tokens"]) == 2
+        assert first_page["next_cursor"] is not None
+
+        response = await client.get(
+            f"/api/v1/tokens?limit=2&cursor={first_page['next_cursor']}",
+            headers={"Authorization": f"Bearer {user_a_jwt}"}
+        )
+        assert response.status_code == 200
+        second_page = response.json()["data"]
+        assert len(second_page["tokens"]) == 1
+        assert second_page["next_cursor"] is None
+
+        ids = [t["id"] for t in first_page["tokens"] + second_page["tokens"]]
+        assert len(set(ids)) == 3
+
+    async def test_list_tokens_422_invalid_cursor(
+        self, client: AsyncClient, user_a_jwt: str
+    ):
+        """Test listing tokens with a malformed cursor returns 422."""
+        response = await client.get(
+            "/api/v1/tokens?limit=2&cursor=not-a-cursor",
+            headers={"Authorization": f"Bearer {user_a_jwt}"}
+        )
+        assert response.status_code == 422
+
     async def test_list_tokens_401_no_authorization_header(
         self, client: AsyncClient
     ):
@@ -269,6 +341,27 @@ class TestGetToken:
         assert "token" not in data  # Full token should not be exposed
         assert data["id"] == str(token.id)
 
+    async def test_get_token_last_used_at_after_flush(
+        self, client: AsyncClient, test_db, user_a: User, user_a_jwt: str, create_pat_token
+    ):
+        """Test PAT usage is reflected in last_used_at once buffered writes are flushed."""
+        full_token, token = await create_pat_token(user_a.id, scopes=["workspacess:read"])
+
+        response = await client.get(
+            "/api/v1/workspacess",
+            headers={"Authorization": f"Bearer {full_token}"}
+        )
+        assert response.status_code == 200
+
+        await flush_last_used(test_db)
+
+        response = await client.get(
+            f"/api/v1/tokens/{token.id}",
+            headers={"Authorization": f"Bearer {user_a_jwt}"}
+        )
+        assert response.status_code == 200
+        assert response.json()["data"]["last_used_at"] is not None
+
     async def test_get_token_404_not_found(
         self, client: AsyncClient, user_a_jwt: str
     ):
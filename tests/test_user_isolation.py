@@ -17,12 +17,14 @@ class TestUserIsolation:
 
     async def test_user_a_cannot_list_user_b_tokens(
         self, client: AsyncClient, user_a: User, user_b: User,
-        user_a_jwt: str, user_b_jwt: str, create_pat_token
+        user_a_jwt: str, user_b_jwt: str, bulk_create_pat_tokens
     ):
         """Test that User A cannot see User B's tokens."""
         # Create tokens for both users
-        _, token_a = await create_pat_token(user_a.id, scopes=["workspacess:read"], name="Token A")
-        _, token_b = await create_pat_token(user_b.id, scopes=["workspacess:read"], name="Token B")
+        (_, token_a), (_, token_b) = await bulk_create_pat_tokens([
+            {"user_id": user_a.id, "scopes": ["workspacess:read"], "name": "Token A"},
+            {"user_id": user_b.id, "scopes": ["workspacess:read"], "name": "Token B"},
+        ])
 
         # User A lists their tokens
         response = await client.get(
@@ -95,12 +97,14 @@ class TestUserIsolation:
 
     async def test_user_can_only_access_own_tokens(
         self, client: AsyncClient, user_a: User, user_b: User,
-        user_a_jwt: str, user_b_jwt: str, create_pat_token
+        user_a_jwt: str, user_b_jwt: str, bulk_create_pat_tokens
     ):
         """Test that users can only access their own tokens."""
         # Create tokens for both users
-        _, token_a = await create_pat_token(user_a.id, scopes=["workspacess:read"], name="Token A")
-        _, token_b = await create_pat_token(user_b.id, scopes=["workspacess:read"], name="Token B")
+        (_, token_a), (_, token_b) = await bulk_create_pat_tokens([
+            {"user_id": user_a.id, "scopes": ["workspacess:read"], "name": "Token A"},
+            {"user_id": user_b.id, "scopes": ["workspacess:read"], "name": "Token B"},
+        ])
 
         # User A can access their own token
         response = await client.get(